@@ -0,0 +1,2 @@
+# backend/app/ai_models/__init__.py
+"""AI models for spending prediction, anomaly detection and goal scoring"""
@@ -0,0 +1,2 @@
+# backend/app/ai_models/analyzers/__init__.py
+"""Spending analyzers"""
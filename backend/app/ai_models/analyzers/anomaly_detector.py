@@ -120,25 +120,23 @@ class AnomalyDetector:
     
     def _create_anomaly_features(self, df: pd.DataFrame) -> np.ndarray:
         """Create features for Isolation Forest."""
-        features = []
-        
-        for _, row in df.iterrows():
-            amount = row['amount']
-            
-            # Normalized amount
-            amount_z = (amount - self.stats['amount']['mean']) / (self.stats['amount']['std'] + 1e-6)
-            
-            # Category deviation
-            cat = row.get('category_name', 'Unknown')
-            if cat in self.stats.get('categories', {}):
-                cat_stats = self.stats['categories'][cat]
-                cat_z = (amount - cat_stats['mean']) / (cat_stats['std'] + 1e-6)
-            else:
-                cat_z = 0
-            
-            features.append([amount, amount_z, cat_z])
-        
-        return np.array(features)
+        amounts = df['amount'].to_numpy(np.float64)
+        
+        # Normalized amount
+        amount_stats = self.stats['amount']
+        amount_z = (amounts - amount_stats['mean']) / (amount_stats['std'] + 1e-6)
+        
+        # Category deviation (0 for categories without baseline stats)
+        cat_z = np.zeros(len(amounts))
+        categories = self.stats.get('categories', {})
+        if categories and 'category_name' in df.columns:
+            names = df['category_name']
+            cat_mean = names.map({cat: s['mean'] for cat, s in categories.items()}).to_numpy(np.float64)
+            cat_std = names.map({cat: s['std'] for cat, s in categories.items()}).to_numpy(np.float64)
+            known = names.isin(categories.keys()).to_numpy()
+            cat_z[known] = (amounts[known] - cat_mean[known]) / (cat_std[known] + 1e-6)
+        
+        return np.column_stack((amounts, amount_z, cat_z))
     
     def detect_anomalies(
         self,
@@ -0,0 +1,2 @@
+# backend/app/ai_models/predictors/__init__.py
+"""Spending and goal predictors"""
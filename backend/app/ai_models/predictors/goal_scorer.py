@@ -311,11 +311,20 @@ class GoalAchievementScorer(BasePredictor):
         # Get probability
         prob = self.model.predict_proba(X_scaled)[0, 1]
         
+        return self._build_result(goal_data, X[0], prob)
+    
+    def _build_result(
+        self,
+        goal_data: Dict,
+        features: np.ndarray,
+        prob: float
+    ) -> Dict[str, any]:
+        """Assemble the scoring result for one goal from its features."""
         # Risk factors
-        risk_factors = self._identify_risk_factors(X[0], prob)
+        risk_factors = self._identify_risk_factors(features, prob)
         
         # Recommendations
-        recommendations = self._generate_recommendations(goal_data, X[0], prob)
+        recommendations = self._generate_recommendations(goal_data, features, prob)
         
         return {
             'probability': round(prob * 100, 1),  # As percentage
@@ -323,10 +332,10 @@ class GoalAchievementScorer(BasePredictor):
             'risk_factors': risk_factors,
             'recommendations': recommendations,
             'details': {
-                'completion_rate': round(X[0][0] * 100, 1),
-                'days_remaining': int(X[0][1]),
-                'required_daily_savings': round(X[0][3], 2),
-                'on_track': bool(X[0][12]),
+                'completion_rate': round(features[0] * 100, 1),
+                'days_remaining': int(features[1]),
+                'required_daily_savings': round(features[3], 2),
+                'on_track': bool(features[12]),
             }
         }
     
@@ -433,8 +442,25 @@ class GoalAchievementScorer(BasePredictor):
         income_data: Optional[Dict] = None,
         spending_data: Optional[Dict] = None
     ) -> List[Dict]:
-        """Score multiple goals at once."""
-        return [
-            self.predict(goal, income_data, spending_data)
+        """
+        Score multiple goals at once.
+        
+        Features for all goals are stacked into one matrix so scaling and
+        the model run once for the batch instead of once per goal.
+        """
+        if not self.is_trained:
+            raise ValueError("Model not trained. Call train() first.")
+        
+        if not goals:
+            return []
+        
+        X = np.vstack([
+            self._calculate_features(goal, income_data, spending_data)
             for goal in goals
+        ])
+        probs = self.model.predict_proba(self.scaler.transform(X))[:, 1]
+        
+        return [
+            self._build_result(goal, features, prob)
+            for goal, features, prob in zip(goals, X, probs)
         ]
\ No newline at end of file
@@ -7,6 +7,7 @@ Prepare and transform data for ML models
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, date, timedelta
 from uuid import UUID
+import copy
 
 import numpy as np
 import pandas as pd
@@ -23,8 +24,75 @@ class DataPreprocessor:
     Prepare data from database for ML model training and prediction.
     """
     
+    # Columns added to expense rows when include_emotions is set
+    EMOTION_COLUMNS = [
+        'primary_emotion', 'emotion_intensity', 'stress_level', 'was_urgent',
+        'was_necessary', 'is_asset', 'regret_level', 'brought_joy',
+        'time_of_day', 'day_type', 'trigger_event',
+    ]
+    
     def __init__(self, db: Session):
         self.db = db
+        
+        # (user_id, days_back, expenses with emotions) from preload
+        self._preloaded: Optional[Tuple[UUID, int, pd.DataFrame]] = None
+    
+    def with_session(self, db: Session) -> 'DataPreprocessor':
+        """Copy bound to another session, keeping any preloaded expenses."""
+        other = copy.copy(self)
+        other.db = db
+        return other
+    
+    def preload(self, user_id: UUID, max_days: int = 90) -> None:
+        """
+        Fetch the user's expenses once and keep them for later calls.
+        
+        Subsequent get_user_expenses / get_daily_spending_summary calls for
+        this user with days_back <= max_days slice the in-memory frame
+        instead of querying again.
+        """
+        expenses_df = self.get_user_expenses(user_id, max_days, include_emotions=True)
+        self._preloaded = (user_id, max_days, expenses_df)
+    
+    def get_all_analytics_inputs(
+        self,
+        user_id: UUID,
+        max_days: int = 90
+    ) -> Dict[str, pd.DataFrame]:
+        """Preload the user's expenses and return every analytics frame from them."""
+        self.preload(user_id, max_days)
+        
+        return {
+            'expenses_df': self.get_user_expenses(user_id, max_days, include_emotions=False),
+            'expenses_emotion_df': self._preloaded[2],
+            'daily_df': self.get_daily_spending_summary(user_id, max_days),
+        }
+    
+    def _slice_preloaded(
+        self,
+        user_id: UUID,
+        days_back: int,
+        include_emotions: bool
+    ) -> Optional[pd.DataFrame]:
+        """Serve an expense window from the preloaded frame, if it covers it."""
+        if self._preloaded is None:
+            return None
+        
+        loaded_user, loaded_days, expenses_df = self._preloaded
+        if loaded_user != user_id or days_back > loaded_days:
+            return None
+        
+        if expenses_df.empty:
+            return pd.DataFrame()
+        
+        cutoff_date = date.today() - timedelta(days=days_back)
+        window = expenses_df[expenses_df['expense_date'] >= cutoff_date]
+        if window.empty:
+            return pd.DataFrame()
+        
+        if not include_emotions:
+            window = window.drop(columns=self.EMOTION_COLUMNS, errors='ignore')
+        return window.reset_index(drop=True)
     
     def get_user_expenses(
         self,
@@ -35,6 +103,10 @@ class DataPreprocessor:
         """
         Get user's expense history as a DataFrame.
         """
+        preloaded = self._slice_preloaded(user_id, days_back, include_emotions)
+        if preloaded is not None:
+            return preloaded
+        
         cutoff_date = date.today() - timedelta(days=days_back)
         
         query = self.db.query(Expense).filter(
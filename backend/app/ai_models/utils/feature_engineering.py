@@ -213,9 +213,9 @@ class FeatureEngineer:
         
         # Days to deadline
         if 'deadline_date' in df.columns:
-            df['days_to_deadline'] = df['deadline_date'].apply(
-                lambda x: (x - today).days if pd.notna(x) else 365
-            )
+            df['days_to_deadline'] = (
+                pd.to_datetime(df['deadline_date']) - pd.Timestamp(today)
+            ).dt.days.fillna(365)
             df['days_to_deadline'] = df['days_to_deadline'].clip(lower=0)
         
         # Required daily savings
@@ -0,0 +1,2 @@
+# backend/app/api/__init__.py
+"""API layer"""
@@ -2,6 +2,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Generator
+from datetime import datetime
 
 from app.database import get_db
 from app.core.security import decode_access_token
@@ -45,4 +46,9 @@ def get_current_user(
             detail="Inactive user"
         )
     
-    return user
\ No newline at end of file
+    return user
+
+
+def get_request_timestamp() -> str:
+    """UTC timestamp for the current request, computed once per request"""
+    return datetime.utcnow().isoformat(timespec='seconds')
@@ -24,4 +24,4 @@ api_router.include_router(goals.router, prefix="/goals", tags=["Goals"])
 api_router.include_router(recurring_expenses.router, prefix="/recurring-expenses", tags=["Recurring Expenses"])
 api_router.include_router(dependents.router, prefix="/dependents", tags=["Dependents"])
 api_router.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
-api_router.include_router(insights.router, prefix="/insights", tags=["AI Insights"])ß
\ No newline at end of file
+api_router.include_router(insights.router, prefix="/insights", tags=["AI Insights"])
@@ -0,0 +1,54 @@
+# backend/app/api/routing.py
+"""
+Custom route classes for API routers
+"""
+
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError as PydanticValidationError
+
+
+class JSONBodyRoute(APIRoute):
+    """
+    Route that parses and validates its JSON body in one pass.
+
+    For routes with a single Pydantic body model, the raw body goes through
+    model_validate_json instead of json.loads followed by model validation,
+    so no intermediate dict is built. The endpoint keeps its typed body
+    parameter: the OpenAPI schema is unchanged, FastAPI receives the
+    validated instance and does not validate it again, and errors keep
+    their ("body", ...) loc.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        body_params = self.dependant.body_params
+        if len(body_params) != 1 or getattr(body_params[0].field_info, "embed", False):
+            return handler
+        model = body_params[0].field_info.annotation
+        if not (isinstance(model, type) and issubclass(model, BaseModel)):
+            return handler
+
+        async def json_body_handler(request: Request) -> Response:
+            content_type = request.headers.get("content-type", "")
+            body = await request.body()
+            if body and (not content_type or "json" in content_type):
+                try:
+                    # FastAPI reads the body through request.json(), which
+                    # returns this cached value
+                    request._json = model.model_validate_json(body)
+                except PydanticValidationError as e:
+                    raise RequestValidationError(
+                        [
+                            {**error, "loc": ("body", *error["loc"])}
+                            for error in e.errors(include_url=False)
+                        ],
+                        body=body,
+                    )
+            return await handler(request)
+
+        return json_body_handler
@@ -0,0 +1,2 @@
+# backend/app/api/v1/__init__.py
+"""Version 1 API endpoints"""
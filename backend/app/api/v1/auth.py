@@ -50,8 +50,8 @@ def login_user(credentials: UserLogin, db: Session = Depends(get_db)):
 
     access_token = create_access_token(data={"sub": str(user.user_id)})
 
-    return Token(access_token=access_token, user=UserResponse.from_orm(user))
+    return Token(access_token=access_token, user=UserResponse.model_validate(user))
 
 @router.get("/me", response_model=UserResponse)
 def get_current_user_info(current_user: User = Depends(get_current_user)):
-    return UserResponse.from_orm(current_user)
+    return UserResponse.model_validate(current_user)
@@ -19,6 +19,7 @@ from app.schemas.budget import (
     BudgetHistoryResponse, BudgetStats,
     QuickBudgetCreate, ApplyTemplateRequest
 )
+from app.schemas._construct import from_orm_fast
 from app.core.exceptions import NotFoundError, ValidationError
 
 router = APIRouter()
@@ -112,6 +113,8 @@ def update_budget(
         return service.update_budget(current_user.user_id, budget_id, data)
     except NotFoundError:
         raise HTTPException(status_code=404, detail="Budget not found")
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -206,7 +209,8 @@ def get_budget_history(
     """Get budget history for charting"""
     service = BudgetService(db)
     try:
-        return service.get_budget_history(current_user.user_id, budget_id, days)
+        history = service.get_budget_history(current_user.user_id, budget_id, days)
+        return [from_orm_fast(BudgetHistoryResponse, h) for h in history]
     except NotFoundError:
         raise HTTPException(status_code=404, detail="Budget not found")
 
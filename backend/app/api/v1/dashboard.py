@@ -5,20 +5,21 @@ Main endpoint for mobile app home screen
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
-from datetime import date
+from datetime import date, datetime
 
 from app.database import get_db
 from app.api.deps import get_current_user
 from app.models.user import User
-from app.services.dashboard_service import DashboardService
+from app.services.dashboard_service import DashboardService, DashboardDates
 
 router = APIRouter()
 
 
-@router.get("/")
-def get_dashboard(
+@router.get("/", response_class=ORJSONResponse)
+async def get_dashboard(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -41,7 +42,8 @@ def get_dashboard(
     - Check-in status
     """
     service = DashboardService(db)
-    return service.get_dashboard(current_user.user_id)
+    # Sections hold raw UUIDs, dates and datetimes; orjson encodes them natively
+    return ORJSONResponse(await service.get_dashboard(current_user.user_id))
 
 
 @router.get("/quick-stats")
@@ -51,17 +53,19 @@ def get_quick_stats(
 ):
     """Get just the quick stats for header"""
     service = DashboardService(db)
-    return service._get_quick_stats(current_user.user_id, date.today())
+    return service._get_quick_stats(current_user.user_id, DashboardDates.for_day(date.today()))
 
 
-@router.get("/today")
+@router.get("/today", response_class=ORJSONResponse)
 def get_today_summary(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get today's spending summary"""
     service = DashboardService(db)
-    return service._get_today_spending(current_user.user_id, date.today())
+    return ORJSONResponse(
+        service._get_today_spending(current_user.user_id, DashboardDates.for_day(date.today()))
+    )
 
 
 @router.get("/weekly-summary")
@@ -74,17 +78,17 @@ def get_weekly_summary(
     return service.get_weekly_summary(current_user.user_id)
 
 
-@router.get("/goals-overview")
+@router.get("/goals-overview", response_class=ORJSONResponse)
 def get_goals_overview(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get goals overview for dashboard"""
     service = DashboardService(db)
-    return service._get_goals_overview(current_user.user_id)
+    return ORJSONResponse(service._get_goals_overview(current_user.user_id))
 
 
-@router.get("/upcoming-bills")
+@router.get("/upcoming-bills", response_class=ORJSONResponse)
 def get_upcoming_bills(
     days: int = Query(7, ge=1, le=30, description="Days ahead to check"),
     db: Session = Depends(get_db),
@@ -94,20 +98,36 @@ def get_upcoming_bills(
     from datetime import timedelta
     service = DashboardService(db)
     
-    today = date.today()
+    dates = DashboardDates.for_day(date.today())
     # Modify the service method call - this is a simplified version
-    return service._get_upcoming_bills(current_user.user_id, today)
+    return ORJSONResponse(service._get_upcoming_bills(current_user.user_id, dates))
 
 
-@router.get("/recent-transactions")
+@router.get("/recent-transactions", response_class=ORJSONResponse)
 def get_recent_transactions(
     limit: int = Query(10, ge=1, le=50),
+    before_date: Optional[date] = Query(None, description="date of the last transaction already shown"),
+    before_created_at: Optional[datetime] = Query(None, description="created_at of the last transaction already shown"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get recent transactions"""
+    """
+    Get recent transactions.
+    
+    For the next page, pass the last transaction's `date` and `created_at`
+    as `before_date` and `before_created_at`.
+    """
+    if (before_date is None) != (before_created_at is None):
+        raise HTTPException(
+            status_code=400,
+            detail="before_date and before_created_at must be given together"
+        )
+    
+    before = (before_date, before_created_at) if before_date is not None else None
     service = DashboardService(db)
-    return service._get_recent_transactions(current_user.user_id)
+    return ORJSONResponse(
+        service._get_recent_transactions(current_user.user_id, limit=limit, before=before)
+    )
 
 
 @router.get("/checkin-status")
@@ -117,7 +137,7 @@ def get_checkin_status(
 ):
     """Get today's check-in status"""
     service = DashboardService(db)
-    return service._get_checkin_status(current_user.user_id, date.today())
+    return service._get_checkin_status(current_user.user_id, DashboardDates.for_day(date.today()))
 
 
 @router.get("/streaks")
@@ -127,7 +127,7 @@ async def get_dependent(
     service = DependentService(db)
     
     try:
-        dependent = service.get_dependent(dependent_id, current_user.user_id)
+        dependent = service.get_dependent(dependent_id, current_user.user_id, include_related=True)
         return _build_dependent_response(dependent)
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -520,7 +520,7 @@ def _build_dependent_response(dependent) -> DependentResponse:
         dependent_id=dependent.dependent_id,
         user_id=dependent.user_id,
         dependent_name=dependent.dependent_name,
-        relationship=dependent.relationship,
+        relationship=dependent.relationship_type,
         dependent_type=dependent.dependent_type,
         dependent_category=dependent.dependent_category,
         date_of_birth=dependent.date_of_birth,
@@ -566,7 +566,7 @@ def _build_dependent_summary(dependent) -> DependentSummary:
     return DependentSummary(
         dependent_id=dependent.dependent_id,
         dependent_name=dependent.dependent_name,
-        relationship=dependent.relationship,
+        relationship=dependent.relationship_type,
         dependent_type=dependent.dependent_type,
         dependent_category=dependent.dependent_category,
         monthly_cost_estimate=dependent.monthly_cost_estimate,
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 from datetime import date
+from operator import attrgetter
 
 from app.database import get_db
 from app.api.deps import get_current_user
@@ -25,9 +26,12 @@ from app.schemas.expense import (
     ExpenseStats, EmotionalSpendingStats, MonthlySpendingBreakdown,
     CategoryType
 )
+from app.schemas._construct import from_orm_fast
 from app.core.exceptions import NotFoundError, ValidationError
+from app.api.routing import JSONBodyRoute
 
-router = APIRouter(prefix="/expenses", tags=["Expenses"])
+# JSON bodies (notably BulkExpenseLog) are parsed and validated in one pass
+router = APIRouter(prefix="/expenses", tags=["Expenses"], route_class=JSONBodyRoute)
 
 
 # ============================================
@@ -449,7 +453,7 @@ async def bulk_log(
     
     return {
         "expenses_logged": len(expenses),
-        "total_amount": sum(float(e.amount) for e in expenses),
+        "total_amount": float(sum(map(attrgetter('amount'), expenses))),
         "checkin_completed": checkin.completed_at is not None,
         "current_streak": checkin.current_streak
     }
@@ -467,50 +471,11 @@ def _build_expense_response(expense) -> ExpenseResponse:
     
     emotion_response = None
     if expense.emotion:
-        emotion_response = ExpenseEmotionResponse(
-            emotion_id=expense.emotion.emotion_id,
-            expense_id=expense.emotion.expense_id,
-            was_urgent=expense.emotion.was_urgent,
-            was_necessary=expense.emotion.was_necessary,
-            is_asset=expense.emotion.is_asset,
-            primary_emotion=expense.emotion.primary_emotion,
-            emotion_intensity=expense.emotion.emotion_intensity,
-            secondary_emotions=expense.emotion.secondary_emotions,
-            purchase_reason=expense.emotion.purchase_reason,
-            time_of_day=expense.emotion.time_of_day,
-            day_type=expense.emotion.day_type,
-            stress_level=expense.emotion.stress_level,
-            trigger_event=expense.emotion.trigger_event,
-            regret_level=expense.emotion.regret_level,
-            brought_joy=expense.emotion.brought_joy,
-            would_buy_again=expense.emotion.would_buy_again,
-            reflection_notes=expense.emotion.reflection_notes,
-            created_at=expense.emotion.created_at,
-            reflected_at=expense.emotion.reflected_at
-        )
+        emotion_response = from_orm_fast(ExpenseEmotionResponse, expense.emotion)
     
-    return ExpenseResponse(
-        expense_id=expense.expense_id,
-        user_id=expense.user_id,
-        category_id=expense.category_id,
-        expense_name=expense.expense_name,
-        description=expense.description,
-        amount=expense.amount,
-        expense_date=expense.expense_date,
-        expense_time=expense.expense_time,
-        merchant_name=expense.merchant_name,
-        location=expense.location,
-        payment_method=expense.payment_method,
-        is_recurring=expense.is_recurring,
-        recurring_expense_id=expense.recurring_expense_id,
-        dependent_id=expense.dependent_id,
-        tags=expense.tags,
-        receipt_url=expense.receipt_url,
-        is_planned=expense.is_planned,
-        logged_immediately=expense.logged_immediately,
-        notes=expense.notes,
-        created_at=expense.created_at,
-        updated_at=expense.updated_at,
+    return from_orm_fast(
+        ExpenseResponse,
+        expense,
         category_name=category_name,
         emotion=emotion_response
     )
@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
-from datetime import date, datetime
+from datetime import date
 
 from app.database import get_db
 from app.api.deps import get_current_user
@@ -16,8 +16,12 @@ from app.models.goal import FinancialGoal, GoalMilestone, GoalProgressHistory
 from app.schemas.goal import (
     FinancialGoalCreate, FinancialGoalUpdate, FinancialGoalResponse, FinancialGoalWithDetails,
     GoalMilestoneCreate, GoalMilestoneResponse,
-    GoalProgressCreate, GoalProgressResponse
+    GoalProgressCreate, GoalProgressResponse,
+    MILESTONES_ADAPTER, PROGRESS_ADAPTER
 )
+from app.schemas._construct import from_orm_fast
+from app.services.goal_service import GoalService
+from app.core.exceptions import NotFoundError
 
 router = APIRouter()
 
@@ -33,17 +37,10 @@ def create_goal(
 ):
     """Create a new financial goal"""
     
-    db_goal = FinancialGoal(
-        **goal_data.dict(),
-        user_id=current_user.user_id
-    )
-    
-    db.add(db_goal)
-    db.commit()
-    db.refresh(db_goal)
+    db_goal = GoalService(db).create_goal(current_user.user_id, goal_data)
     
     # Calculate progress percentage
-    response = FinancialGoalResponse.from_orm(db_goal)
+    response = from_orm_fast(FinancialGoalResponse, db_goal)
     if db_goal.target_amount > 0:
         response.progress_percentage = float((db_goal.current_amount / db_goal.target_amount) * 100)
     
@@ -78,7 +75,7 @@ def get_goals(
     # Add calculated fields
     result = []
     for goal in goals:
-        goal_response = FinancialGoalResponse.from_orm(goal)
+        goal_response = from_orm_fast(FinancialGoalResponse, goal)
         
         # Progress percentage
         if goal.target_amount > 0:
@@ -124,7 +121,12 @@ def get_goal(
     ).order_by(GoalProgressHistory.contribution_date.desc()).limit(10).all()
     
     # Build response
-    goal_response = FinancialGoalWithDetails.from_orm(goal)
+    goal_response = from_orm_fast(
+        FinancialGoalWithDetails,
+        goal,
+        milestones=MILESTONES_ADAPTER.validate_python(milestones, from_attributes=True),
+        recent_progress=PROGRESS_ADAPTER.validate_python(recent_progress, from_attributes=True)
+    )
     
     # Calculated fields
     if goal.target_amount > 0:
@@ -139,9 +141,6 @@ def get_goal(
             remaining_amount = float(goal.target_amount - goal.current_amount)
             goal_response.required_monthly_savings = remaining_amount / months_remaining if months_remaining > 0 else remaining_amount
     
-    goal_response.milestones = [GoalMilestoneResponse.from_orm(m) for m in milestones]
-    goal_response.recent_progress = [GoalProgressResponse.from_orm(p) for p in recent_progress]
-    
     return goal_response
 
 @router.put("/{goal_id}", response_model=FinancialGoalResponse)
@@ -153,29 +152,12 @@ def update_goal(
 ):
     """Update a goal"""
     
-    goal = db.query(FinancialGoal).filter(
-        FinancialGoal.goal_id == goal_id,
-        FinancialGoal.user_id == current_user.user_id
-    ).first()
+    try:
+        goal = GoalService(db).update_goal(goal_id, current_user.user_id, goal_data)
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Goal not found"
-        )
-    
-    # Update fields
-    for field, value in goal_data.dict(exclude_unset=True).items():
-        setattr(goal, field, value)
-    
-    # If status changed to completed, set completed_at
-    if goal_data.status == "completed" and not goal.completed_at:
-        goal.completed_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(goal)
-    
-    return FinancialGoalResponse.from_orm(goal)
+    return from_orm_fast(FinancialGoalResponse, goal)
 
 @router.delete("/{goal_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_goal(
@@ -185,19 +167,10 @@ def delete_goal(
 ):
     """Delete a goal"""
     
-    goal = db.query(FinancialGoal).filter(
-        FinancialGoal.goal_id == goal_id,
-        FinancialGoal.user_id == current_user.user_id
-    ).first()
-    
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Goal not found"
-        )
-    
-    db.delete(goal)
-    db.commit()
+    try:
+        GoalService(db).delete_goal(goal_id, current_user.user_id)
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     
     return None
 
@@ -214,44 +187,10 @@ def add_progress(
 ):
     """Add progress to a goal (contribute money)"""
     
-    goal = db.query(FinancialGoal).filter(
-        FinancialGoal.goal_id == goal_id,
-        FinancialGoal.user_id == current_user.user_id
-    ).first()
-    
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Goal not found"
-        )
-    
-    # Update goal amount
-    goal.current_amount += progress_data.amount_added
-    new_total = goal.current_amount
-    
-    # Calculate progress percentage
-    progress_percentage = (new_total / goal.target_amount) * 100 if goal.target_amount > 0 else 0
-    
-    # Create progress record
-    db_progress = GoalProgressHistory(
-        goal_id=goal_id,
-        amount_added=progress_data.amount_added,
-        new_total=new_total,
-        progress_percentage=progress_percentage,
-        contribution_date=progress_data.contribution_date,
-        source=progress_data.source,
-        notes=progress_data.notes
-    )
-    
-    db.add(db_progress)
-    
-    # Check if goal is completed
-    if goal.current_amount >= goal.target_amount and goal.status == 'active':
-        goal.status = 'completed'
-        goal.completed_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(db_progress)
+    try:
+        db_progress = GoalService(db).add_progress(goal_id, current_user.user_id, progress_data)
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     
     return db_progress
 
@@ -22,6 +22,7 @@ from app.schemas.income import (
     StudentJobSetup, ScholarshipSetup,
     IncomeSourceType, PaymentFrequency
 )
+from app.schemas._construct import from_orm_fast
 from app.core.exceptions import NotFoundError, ValidationError
 
 router = APIRouter(prefix="/income", tags=["Income"])
@@ -333,43 +334,11 @@ async def setup_scholarship(
 
 def _build_income_response(income) -> IncomeSourceResponse:
     """Build full income response"""
-    return IncomeSourceResponse(
-        income_id=income.income_id,
-        user_id=income.user_id,
-        source_name=income.source_name,
-        source_type=income.source_type,
-        employer_name=income.employer_name,
-        description=income.description,
-        pay_structure=income.pay_structure,
-        pay_rate=income.pay_rate,
-        pay_unit=income.pay_unit,
-        fixed_amount=income.fixed_amount,
-        frequency=income.frequency,
-        next_payment_date=income.next_payment_date,
-        max_hours_per_week=income.max_hours_per_week,
-        expected_hours_per_period=income.expected_hours_per_period,
-        is_taxable=income.is_taxable,
-        tax_rate_federal=income.tax_rate_federal,
-        tax_rate_state=income.tax_rate_state,
-        tax_rate_local=income.tax_rate_local,
-        tax_rate_fica=income.tax_rate_fica,
-        tax_withholding_type=income.tax_withholding_type,
-        is_guaranteed=income.is_guaranteed,
-        reliability_score=income.reliability_score,
-        is_active=income.is_active,
-        start_date=income.start_date,
-        end_date=income.end_date,
-        notes=income.notes,
-        created_at=income.created_at,
-        updated_at=income.updated_at,
-        # Computed
-        total_tax_rate=income.total_tax_rate,
-        estimated_gross_per_period=income.estimated_gross_per_period,
-        estimated_net_per_period=income.estimated_net_per_period,
-        estimated_monthly_gross=income.estimated_monthly_gross,
-        estimated_monthly_net=income.estimated_monthly_net,
-        # History
-        recent_payments=income.history[:5] if income.history else []
+    recent = income.history[:5] if income.history else []
+    return from_orm_fast(
+        IncomeSourceResponse,
+        income,
+        recent_payments=[from_orm_fast(IncomeHistoryResponse, h) for h in recent]
     )
 
 
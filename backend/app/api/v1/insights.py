@@ -11,7 +11,7 @@ from uuid import UUID
 from datetime import date
 
 from app.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_request_timestamp
 from app.models.user import User
 from app.services.ai_service import AIService
 
@@ -27,6 +27,7 @@ router = APIRouter()
     summary="Get all AI insights for dashboard"
 )
 async def get_dashboard_insights(
+    now_iso: str = Depends(get_request_timestamp),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -41,7 +42,7 @@ async def get_dashboard_insights(
     - Alerts and recommendations
     """
     ai_service = AIService(db)
-    return ai_service.get_dashboard_insights(current_user.user_id)
+    return await ai_service.get_dashboard_insights(current_user.user_id, now_iso)
 
 
 # ============================================
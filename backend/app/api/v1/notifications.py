@@ -4,6 +4,7 @@ Notifications API Endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
@@ -23,12 +24,14 @@ from app.core.exceptions import NotFoundError
 
 router = APIRouter()
 
+_NOTIFICATION_FIELDS = tuple(NotificationResponse.model_fields)
+
 
 # ============================================
 # NOTIFICATIONS
 # ============================================
 
-@router.get("/", response_model=NotificationList)
+@router.get("/", response_model=NotificationList, response_class=ORJSONResponse)
 def get_notifications(
     unread_only: bool = Query(False, description="Only show unread"),
     category: Optional[str] = Query(None, description="Filter by category"),
@@ -49,13 +52,18 @@ def get_notifications(
         offset=offset
     )
     
-    return NotificationList(
-        notifications=[NotificationResponse.model_validate(n) for n in notifications],
-        total=total,
-        unread_count=unread,
-        page=page,
-        per_page=per_page
-    )
+    # Rows are trusted, so skip the NotificationList model and let orjson
+    # encode the envelope directly (UUIDs and datetimes are native to orjson)
+    return ORJSONResponse({
+        "notifications": [
+            {field: getattr(n, field) for field in _NOTIFICATION_FIELDS}
+            for n in notifications
+        ],
+        "total": total,
+        "unread_count": unread,
+        "page": page,
+        "per_page": per_page,
+    })
 
 
 @router.get("/unread-count")
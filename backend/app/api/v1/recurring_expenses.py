@@ -10,6 +10,8 @@ from typing import List, Optional
 from uuid import UUID
 from datetime import date
 
+import msgspec
+
 from app.database import get_db
 from app.api.deps import get_current_user
 from app.models.user import User
@@ -20,9 +22,12 @@ from app.schemas.recurring_expense import (
     RecordPaymentRequest, PaymentHistoryResponse,
     UpcomingBillResponse, RecurringExpenseStats,
     MonthlyRecurringBreakdown, VariableExpenseAnalysis,
-    ExpenseFrequency, RecurringExpenseType
+    ExpenseFrequency, RecurringExpenseType,
+    PaymentHistoryStruct, RecurringExpenseSummaryStruct, UpcomingBillStruct
 )
 from app.core.exceptions import NotFoundError, ValidationError
+from app.core.responses import MsgspecJSONResponse
+from app.schemas._construct import from_orm_fast
 
 router = APIRouter(prefix="/recurring-expenses", tags=["Recurring Expenses"])
 
@@ -65,6 +70,7 @@ async def create_recurring_expense(
 @router.get(
     "/",
     response_model=List[RecurringExpenseSummary],
+    response_class=MsgspecJSONResponse,
     summary="Get all recurring expenses"
 )
 async def get_recurring_expenses(
@@ -86,12 +92,13 @@ async def get_recurring_expenses(
         order_by=order_by
     )
     
-    return [_build_expense_summary(e) for e in expenses]
+    return MsgspecJSONResponse([_build_summary_struct(e) for e in expenses])
 
 
 @router.get(
     "/stats",
     response_model=RecurringExpenseStats,
+    response_class=MsgspecJSONResponse,
     summary="Get recurring expense statistics"
 )
 async def get_stats(
@@ -106,12 +113,13 @@ async def get_stats(
     - Upcoming and overdue counts
     """
     service = RecurringExpenseService(db)
-    return service.get_stats(current_user.user_id)
+    return MsgspecJSONResponse(service.get_stats(current_user.user_id))
 
 
 @router.get(
     "/upcoming",
     response_model=List[UpcomingBillResponse],
+    response_class=MsgspecJSONResponse,
     summary="Get upcoming bills"
 )
 async def get_upcoming_bills(
@@ -129,8 +137,8 @@ async def get_upcoming_bills(
         include_overdue=include_overdue
     )
     
-    return [
-        UpcomingBillResponse(
+    return MsgspecJSONResponse([
+        UpcomingBillStruct(
             recurring_id=e.recurring_id,
             expense_name=e.expense_name,
             expected_amount=e.expected_amount,
@@ -144,12 +152,13 @@ async def get_upcoming_bills(
             auto_pay=e.auto_pay
         )
         for e in expenses
-    ]
+    ])
 
 
 @router.get(
     "/overdue",
     response_model=List[UpcomingBillResponse],
+    response_class=MsgspecJSONResponse,
     summary="Get overdue bills"
 )
 async def get_overdue_bills(
@@ -160,8 +169,8 @@ async def get_overdue_bills(
     service = RecurringExpenseService(db)
     expenses = service.get_overdue_bills(current_user.user_id)
     
-    return [
-        UpcomingBillResponse(
+    return MsgspecJSONResponse([
+        UpcomingBillStruct(
             recurring_id=e.recurring_id,
             expense_name=e.expense_name,
             expected_amount=e.expected_amount,
@@ -175,12 +184,13 @@ async def get_overdue_bills(
             auto_pay=e.auto_pay
         )
         for e in expenses
-    ]
+    ])
 
 
 @router.get(
     "/monthly-breakdown/{year}/{month}",
     response_model=MonthlyRecurringBreakdown,
+    response_class=MsgspecJSONResponse,
     summary="Get monthly breakdown"
 )
 async def get_monthly_breakdown(
@@ -194,7 +204,7 @@ async def get_monthly_breakdown(
         raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
     
     service = RecurringExpenseService(db)
-    return service.get_monthly_breakdown(current_user.user_id, year, month)
+    return MsgspecJSONResponse(service.get_monthly_breakdown(current_user.user_id, year, month))
 
 
 @router.get(
@@ -299,6 +309,7 @@ async def record_payment(
 @router.get(
     "/{recurring_id}/payments",
     response_model=List[PaymentHistoryResponse],
+    response_class=MsgspecJSONResponse,
     summary="Get payment history"
 )
 async def get_payment_history(
@@ -312,7 +323,10 @@ async def get_payment_history(
     
     try:
         history = service.get_payment_history(recurring_id, current_user.user_id, limit)
-        return history
+        return MsgspecJSONResponse([
+            msgspec.convert(h, PaymentHistoryStruct, from_attributes=True)
+            for h in history
+        ])
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -324,6 +338,7 @@ async def get_payment_history(
 @router.get(
     "/{recurring_id}/analysis",
     response_model=VariableExpenseAnalysis,
+    response_class=MsgspecJSONResponse,
     summary="Analyze a variable expense"
 )
 async def analyze_variable_expense(
@@ -343,7 +358,7 @@ async def analyze_variable_expense(
     service = RecurringExpenseService(db)
     
     try:
-        return service.analyze_variable_expense(recurring_id, current_user.user_id)
+        return MsgspecJSONResponse(service.analyze_variable_expense(recurring_id, current_user.user_id))
     except NotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValidationError as e:
@@ -401,65 +416,14 @@ async def resume_expense(
 
 def _build_expense_response(expense) -> RecurringExpenseResponse:
     """Build full expense response with computed properties"""
-    return RecurringExpenseResponse(
-        recurring_id=expense.recurring_id,
-        user_id=expense.user_id,
-        category_id=expense.category_id,
-        expense_name=expense.expense_name,
-        description=expense.description,
-        base_amount=expense.base_amount,
-        is_variable=expense.is_variable,
-        min_amount=expense.min_amount,
-        max_amount=expense.max_amount,
-        avg_amount=expense.avg_amount,
-        frequency=expense.frequency,
-        frequency_interval=expense.frequency_interval,
-        start_date=expense.start_date,
-        end_date=expense.end_date,
-        next_due_date=expense.next_due_date,
-        preferred_day=expense.preferred_day,
-        auto_pay=expense.auto_pay,
-        payment_method=expense.payment_method,
-        provider_name=expense.provider_name,
-        provider_website=expense.provider_website,
-        account_number=expense.account_number,
-        reminder_enabled=expense.reminder_enabled,
-        reminder_days_before=expense.reminder_days_before,
-        expense_type=expense.expense_type,
-        is_essential=expense.is_essential,
-        notes=expense.notes,
-        tags=expense.tags,
-        is_active=expense.is_active,
-        paused_until=expense.paused_until,
-        created_at=expense.created_at,
-        updated_at=expense.updated_at,
-        # Computed
-        is_due_soon=expense.is_due_soon,
-        is_overdue=expense.is_overdue,
-        days_until_due=expense.days_until_due,
-        expected_amount=expense.expected_amount,
-        monthly_equivalent=expense.monthly_equivalent,
-        annual_cost=expense.annual_cost,
-        variance_percentage=expense.variance_percentage,
-        # History
-        recent_payments=expense.history[:5] if expense.history else []
+    recent = expense.history[:5] if expense.history else []
+    return from_orm_fast(
+        RecurringExpenseResponse,
+        expense,
+        recent_payments=[from_orm_fast(PaymentHistoryResponse, h) for h in recent]
     )
 
 
-def _build_expense_summary(expense) -> RecurringExpenseSummary:
-    """Build lightweight expense summary"""
-    return RecurringExpenseSummary(
-        recurring_id=expense.recurring_id,
-        expense_name=expense.expense_name,
-        expense_type=expense.expense_type,
-        provider_name=expense.provider_name,
-        expected_amount=expense.expected_amount,
-        next_due_date=expense.next_due_date,
-        days_until_due=expense.days_until_due,
-        is_due_soon=expense.is_due_soon,
-        is_overdue=expense.is_overdue,
-        is_essential=expense.is_essential,
-        auto_pay=expense.auto_pay,
-        monthly_equivalent=expense.monthly_equivalent,
-        is_active=expense.is_active
-    )
\ No newline at end of file
+def _build_summary_struct(expense) -> RecurringExpenseSummaryStruct:
+    """Build list-view summary struct for msgspec encoding"""
+    return msgspec.convert(expense, RecurringExpenseSummaryStruct, from_attributes=True)
\ No newline at end of file
@@ -15,6 +15,14 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     API_V1_PREFIX: str = "/api/v1"
 
+    # Build response schemas from ORM rows without re-validating them.
+    # Turn off to validate every response (useful when debugging schemas).
+    SKIP_RESPONSE_VALIDATION: bool = True
+
+    # Raise on lazy relationship loads in eager-loaded service queries
+    # (development aid for catching N+1 regressions)
+    RAISE_ON_LAZY_LOAD: bool = False
+
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY")
     ALGORITHM: str = "HS256"
@@ -57,6 +65,15 @@ class Settings(BaseSettings):
     DB_HOST: str = "localhost"
     DB_PORT: int = 5432
     DB_NAME: str = "fortuna"
+    # Compiled SQL statements kept per engine (SQLAlchemy default is 500)
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # Connection pool: request sessions plus the parallel-read workers below
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    # Process-wide cap on sessions used for parallel reads (dashboard
+    # sections, insight analyses); each holds one pooled connection
+    DB_PARALLEL_SESSIONS: int = 4
 
     @property
     def DATABASE_URL(self) -> str:
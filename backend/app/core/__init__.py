@@ -0,0 +1,2 @@
+# backend/app/core/__init__.py
+"""Core utilities: caching, exceptions, responses, security"""
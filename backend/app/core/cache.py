@@ -0,0 +1,65 @@
+# backend/app/core/cache.py
+"""
+In-process caches for Fortuna services
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after ttl seconds.
+
+    Only for data where a stale read is harmless for up to ttl seconds
+    (metadata, derived summaries). Cache contents must never be needed
+    for correctness.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.pop(key, None)
+            return item[0] if item else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Assembled dashboard payloads per user. Write paths that change what the
+# dashboard shows call invalidate_dashboard after committing. Changes made
+# outside those paths (scheduled cleanups, the date rolling over) show up
+# once the entry expires, at most ttl seconds later.
+dashboard_cache = TTLCache(maxsize=10_000, ttl=30)
+
+
+def invalidate_dashboard(user_id: Hashable) -> None:
+    """Drop a user's cached dashboard so the next request rebuilds it."""
+    dashboard_cache.pop(user_id)
@@ -0,0 +1,25 @@
+# backend/app/core/responses.py
+"""
+Response classes for Fortuna API
+"""
+
+from typing import Any
+
+import msgspec
+from fastapi.responses import JSONResponse
+
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """
+    JSON response encoded with msgspec.
+
+    Use for list endpoints that return msgspec Structs built from trusted
+    database rows. The route keeps its Pydantic response_model for the
+    OpenAPI schema; the Struct content skips Pydantic serialization.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
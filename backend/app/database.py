@@ -1,18 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar, Union
+import asyncio
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.config import settings
 
+T = TypeVar("T")
+
 
 # Create engine
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
     echo=settings.DEBUG
 )
 
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects keep their loaded state after commit; columns filled by the server
+# (defaults, onupdate) are still expired on flush and load on first access.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Base class for models
 Base = declarative_base()
@@ -26,4 +39,30 @@ def get_db():
         yield db
     finally:
         db.close()
-        
\ No newline at end of file
+        
+
+
+# Parallel reads
+# One shared pool of worker threads, so however many requests fan out, at
+# most DB_PARALLEL_SESSIONS extra connections are checked out at once.
+_parallel_executor = ThreadPoolExecutor(
+    max_workers=settings.DB_PARALLEL_SESSIONS,
+    thread_name_prefix="db-parallel"
+)
+
+
+async def run_in_session(bind: Union[Engine, Connection], work: Callable[[Session], T]) -> T:
+    """
+    Run work(session) in a shared worker thread on a fresh session.
+
+    Pass the request session's get_bind() so the work uses the same
+    engine as the request (including get_db overrides).
+    """
+    def run() -> T:
+        db = SessionLocal(bind=bind)
+        try:
+            return work(db)
+        finally:
+            db.close()
+
+    return await asyncio.get_running_loop().run_in_executor(_parallel_executor, run)
@@ -6,9 +6,9 @@ Monthly/weekly budgets, category budgets, and budget tracking
 
 from sqlalchemy import (
     Column, String, Numeric, Boolean, Integer,
-    Date, DateTime, ForeignKey, Text, CheckConstraint
+    Date, DateTime, ForeignKey, Text, CheckConstraint, literal_column, text
 )
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB, ExcludeConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -56,10 +56,19 @@ class Budget(Base):
     
     # Relationships
     user = relationship("User", back_populates="budgets")
-    category_budgets = relationship("CategoryBudget", back_populates="budget", cascade="all, delete-orphan")
+    category_budgets = relationship("CategoryBudget", back_populates="budget", cascade="all, delete-orphan", passive_deletes=True)
     
     __table_args__ = (
         CheckConstraint('alert_at_percentage >= 0 AND alert_at_percentage <= 100', name='check_alert_percentage'),
+        # No two active budgets of the same type may overlap (needs btree_gist)
+        ExcludeConstraint(
+            (user_id, '='),
+            (budget_type, '='),
+            (func.daterange(start_date, end_date, literal_column("'[]'")), '&&'),
+            name='no_overlap_active_budget',
+            using='gist',
+            where=text("status = 'active'"),
+        ),
     )
     
     @property
@@ -184,9 +193,9 @@ class BudgetTemplate(Base):
     budget_type = Column(String(20), nullable=False)  # monthly, weekly
     total_amount = Column(Numeric(12, 2), nullable=False)
     
-    # Category allocations as JSON
+    # Category allocations
     # Format: [{"category_id": "uuid", "amount": 500, "percentage": 25}, ...]
-    category_allocations = Column(Text)  # JSON string
+    category_allocations = Column(JSONB)
     
     savings_target_percentage = Column(Numeric(5, 2))
     
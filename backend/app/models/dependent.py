@@ -6,7 +6,7 @@ Handles financial dependents: humans (family), pets, and shared cost tracking
 
 from sqlalchemy import (
     Column, String, Numeric, Boolean, Integer, 
-    Date, DateTime, ForeignKey, Text, CheckConstraint
+    Date, DateTime, ForeignKey, Text, CheckConstraint, Index
 )
 from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB
 from sqlalchemy.orm import relationship
@@ -83,6 +83,11 @@ class Dependent(Base):
     expense_types = relationship("DependentExpenseType", back_populates="dependent", cascade="all, delete-orphan")
     shared_costs = relationship("DependentSharedCost", back_populates="dependent", cascade="all, delete-orphan")
     
+    # A user's active dependents, newest first (list endpoints, stats)
+    __table_args__ = (
+        Index('idx_dependents_user_active_created', 'user_id', 'is_active', created_at.desc()),
+    )
+    
     @property
     def calculated_age(self):
         """Calculate age from date of birth"""
@@ -109,7 +114,9 @@ class Dependent(Base):
         """Calculate your share of the monthly cost"""
         if not self.monthly_cost_estimate:
             return None
-        share_pct = float(self.your_share_percentage or 100)
+        # Only a missing percentage means the full cost; 0% is a valid share
+        pct = self.your_share_percentage
+        share_pct = 100.0 if pct is None else float(pct)
         return round(float(self.monthly_cost_estimate) * (share_pct / 100), 2)
     
     @property
@@ -199,6 +206,12 @@ class DependentExpense(Base):
     
     # Relationships
     dependent = relationship("Dependent", back_populates="expenses")
+    
+    # Per-dependent expense listing and date-range spending sums
+    __table_args__ = (
+        Index('idx_dependent_expenses_dependent_date', 'dependent_id', expense_date.desc(),
+              postgresql_include=['amount']),
+    )
 
 
 class DependentSharedCost(Base):
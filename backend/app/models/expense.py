@@ -7,7 +7,7 @@ Core feature of Fortuna - understanding the WHY behind spending
 
 from sqlalchemy import (
     Column, String, Numeric, Boolean, Integer,
-    Date, DateTime, Time, ForeignKey, Text, CheckConstraint
+    Date, DateTime, Time, ForeignKey, Text, CheckConstraint, Index
 )
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
@@ -112,6 +112,17 @@ class Expense(Base):
     user = relationship("User", back_populates="expenses")
     category = relationship("ExpenseCategory", back_populates="expenses")
     emotion = relationship("ExpenseEmotion", back_populates="expense", uselist=False, cascade="all, delete-orphan")
+    
+    # Covering indexes for per-user spending sums over a date range
+    __table_args__ = (
+        Index('idx_expenses_user_date', 'user_id', expense_date.desc(),
+              postgresql_include=['amount', 'category_id']),
+        Index('idx_expenses_user_category_date', 'user_id', 'category_id', 'expense_date',
+              postgresql_include=['amount']),
+        # Newest-first listing (dashboard recent transactions)
+        Index('idx_expenses_user_date_created', 'user_id', expense_date.desc(), created_at.desc(),
+              postgresql_include=['amount', 'merchant_name', 'category_id']),
+    )
 
 
 class ExpenseEmotion(Base):
@@ -174,6 +185,7 @@ class ExpenseEmotion(Base):
                        name='check_stress_level'),
         CheckConstraint('regret_level IS NULL OR (regret_level >= 1 AND regret_level <= 10)', 
                        name='check_regret_level'),
+        Index('idx_expense_emotions_expense', 'expense_id'),
     )
 
 
@@ -5,8 +5,8 @@ Track multiple income sources with different pay structures and tax calculations
 """
 
 from sqlalchemy import (
-    Column, String, Numeric, Boolean, Integer,
-    Date, DateTime, ForeignKey, Text, CheckConstraint
+    Column, String, Numeric, Boolean, Integer, Float,
+    Date, DateTime, ForeignKey, Text, CheckConstraint, Computed
 )
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
@@ -18,6 +18,40 @@ import uuid
 from app.database import Base
 
 
+# ============================================
+# DERIVED INCOME EXPRESSIONS
+# Stored generated columns on income_sources, so list endpoints read the
+# estimates instead of recomputing them per row.
+# ============================================
+
+_TOTAL_TAX_RATE_SQL = (
+    "(COALESCE(tax_rate_federal, 0) + COALESCE(tax_rate_state, 0) + COALESCE(tax_rate_local, 0)"
+    " + CASE WHEN is_taxable THEN COALESCE(tax_rate_fica, 0) ELSE 0 END)"
+)
+
+_GROSS_PER_PERIOD_SQL = (
+    "(CASE pay_structure"
+    " WHEN 'fixed' THEN COALESCE(fixed_amount, 0)"
+    " WHEN 'hourly' THEN COALESCE(expected_hours_per_period, 0) * COALESCE(pay_rate, 0)"
+    " WHEN 'salary' THEN COALESCE(pay_rate, 0) / CASE frequency"
+    " WHEN 'weekly' THEN 52 WHEN 'biweekly' THEN 26 WHEN 'monthly' THEN 12 ELSE 1 END"
+    " WHEN 'per_session' THEN COALESCE(pay_rate, 0)"
+    " ELSE 0 END)"
+)
+
+# Pay periods per month (semester is roughly 4 months)
+_MONTHLY_FACTOR_SQL = (
+    "(CASE frequency WHEN 'weekly' THEN 4.33 WHEN 'biweekly' THEN 2.17"
+    " WHEN 'semester' THEN 0.25 ELSE 1 END)"
+)
+
+_NET_FACTOR_SQL = f"(CASE WHEN is_taxable THEN 1 - {_TOTAL_TAX_RATE_SQL} / 100 ELSE 1 END)"
+
+
+def _as_float(expression: str) -> str:
+    return f"CAST({expression} AS DOUBLE PRECISION)"
+
+
 class IncomeSource(Base):
     """
     Income sources - jobs, scholarships, stipends, etc.
@@ -71,6 +105,23 @@ class IncomeSource(Base):
     
     notes = Column(Text)
     
+    # Derived estimates (generated by Postgres, read-only)
+    total_tax_rate = Column(Float, Computed(_as_float(_TOTAL_TAX_RATE_SQL), persisted=True))
+    estimated_gross_per_period = Column(Float, Computed(_as_float(_GROSS_PER_PERIOD_SQL), persisted=True))
+    estimated_net_per_period = Column(
+        Float, Computed(_as_float(f"ROUND({_GROSS_PER_PERIOD_SQL} * {_NET_FACTOR_SQL}, 2)"), persisted=True)
+    )
+    estimated_monthly_gross = Column(
+        Float, Computed(_as_float(f"{_GROSS_PER_PERIOD_SQL} * {_MONTHLY_FACTOR_SQL}"), persisted=True)
+    )
+    estimated_monthly_net = Column(
+        Float,
+        Computed(
+            _as_float(f"ROUND({_GROSS_PER_PERIOD_SQL} * {_MONTHLY_FACTOR_SQL} * {_NET_FACTOR_SQL}, 2)"),
+            persisted=True
+        )
+    )
+    
     # Timestamps
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
@@ -86,70 +137,6 @@ class IncomeSource(Base):
         CheckConstraint('reliability_score >= 0 AND reliability_score <= 1', name='check_reliability'),
     )
     
-    @property
-    def total_tax_rate(self):
-        """Calculate total tax rate"""
-        federal = float(self.tax_rate_federal or 0)
-        state = float(self.tax_rate_state or 0)
-        local = float(self.tax_rate_local or 0)
-        fica = float(self.tax_rate_fica or 0) if self.is_taxable else 0
-        return federal + state + local + fica
-    
-    @property
-    def estimated_gross_per_period(self):
-        """Estimate gross income per pay period"""
-        if self.pay_structure == 'fixed':
-            return float(self.fixed_amount or 0)
-        elif self.pay_structure == 'hourly':
-            hours = float(self.expected_hours_per_period or 0)
-            rate = float(self.pay_rate or 0)
-            return hours * rate
-        elif self.pay_structure == 'salary':
-            # Salary broken into pay periods
-            annual = float(self.pay_rate or 0)
-            if self.frequency == 'weekly':
-                return annual / 52
-            elif self.frequency == 'biweekly':
-                return annual / 26
-            elif self.frequency == 'monthly':
-                return annual / 12
-            return annual
-        elif self.pay_structure == 'per_session':
-            return float(self.pay_rate or 0)
-        return 0
-    
-    @property
-    def estimated_net_per_period(self):
-        """Estimate net income after taxes"""
-        gross = self.estimated_gross_per_period
-        if not self.is_taxable:
-            return gross
-        tax_rate = self.total_tax_rate / 100
-        return round(gross * (1 - tax_rate), 2)
-    
-    @property
-    def estimated_monthly_gross(self):
-        """Estimate monthly gross income"""
-        gross = self.estimated_gross_per_period
-        if self.frequency == 'weekly':
-            return gross * 4.33
-        elif self.frequency == 'biweekly':
-            return gross * 2.17
-        elif self.frequency == 'monthly':
-            return gross
-        elif self.frequency == 'semester':
-            return gross / 4  # Roughly 4 months per semester
-        return gross
-    
-    @property
-    def estimated_monthly_net(self):
-        """Estimate monthly net income"""
-        monthly_gross = self.estimated_monthly_gross
-        if not self.is_taxable:
-            return round(monthly_gross, 2)
-        tax_rate = self.total_tax_rate / 100
-        return round(monthly_gross * (1 - tax_rate), 2)
-    
     def calculate_next_payment_date(self, from_date=None):
         """Calculate next payment date based on frequency"""
         from_date = from_date or self.next_payment_date or date.today()
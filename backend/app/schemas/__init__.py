@@ -0,0 +1,2 @@
+# backend/app/schemas/__init__.py
+"""Pydantic request/response schemas"""
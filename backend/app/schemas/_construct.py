@@ -0,0 +1,82 @@
+# backend/app/schemas/_construct.py
+"""
+Response Helpers
+Shared config for response schemas and fast construction from ORM rows
+"""
+
+from typing import Any, Type, TypeVar
+
+import msgspec
+from pydantic import BaseModel, ConfigDict
+
+from app.config import settings
+
+M = TypeVar("M", bound=BaseModel)
+
+# Response schemas are built from trusted rows: ignore extras, no aliases,
+# no assignment validation, never re-validate nested response instances.
+# The core schema is built on first use rather than at import.
+RESPONSE_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra="ignore",
+    populate_by_name=False,
+    validate_assignment=False,
+    revalidate_instances="never",
+    defer_build=True,
+)
+
+# For response schemas that are never mutated after construction
+FROZEN_RESPONSE_CONFIG = ConfigDict(RESPONSE_CONFIG, frozen=True)
+
+
+def from_orm_fast(cls: Type[M], obj: Any, **overrides: Any) -> M:
+    """
+    Build a response model from a database row using model_construct.
+
+    Rows coming back from SQLAlchemy are already typed by their columns,
+    so per-field validation is skipped. Nested response fields (lists of
+    child rows, embedded responses) must be passed as keyword overrides,
+    already converted. Attributes missing on the row fall back to the
+    field default.
+
+    Only use this for response models - request data must go through
+    model_validate. With SKIP_RESPONSE_VALIDATION off, the same data is
+    run through model_validate instead.
+
+    Every field must already hold the type the schema declares. Values are
+    not converted, so do not use this where a column type differs from the
+    field type (e.g. a DateTime column behind a date field) - use
+    model_validate there.
+    """
+    data = {}
+    for name in cls.model_fields:
+        if name in overrides:
+            data[name] = overrides[name]
+        elif hasattr(obj, name):
+            data[name] = getattr(obj, name)
+    if not settings.SKIP_RESPONSE_VALIDATION:
+        return cls.model_validate(data)
+    return cls.model_construct(**data)
+
+
+def struct_from_model(cls: Type[BaseModel], name: str) -> Type[msgspec.Struct]:
+    """
+    Generate a frozen msgspec Struct with the same fields as a schema.
+
+    List and analytics endpoints encode these directly with
+    MsgspecJSONResponse while the Pydantic model stays the documented
+    response_model. Deriving the Struct from the model keeps the two from
+    drifting apart. Required fields are placed first, as msgspec requires.
+    """
+    required = []
+    optional = []
+    for field_name, field in cls.model_fields.items():
+        if field.is_required():
+            required.append((field_name, field.annotation))
+        elif field.default_factory is not None:
+            optional.append((field_name, field.annotation, msgspec.field(default_factory=field.default_factory)))
+        else:
+            optional.append((field_name, field.annotation, field.default))
+    return msgspec.defstruct(
+        name, required + optional, module=cls.__module__, frozen=True, gc=False
+    )
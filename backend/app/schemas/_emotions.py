@@ -0,0 +1,41 @@
+# backend/app/schemas/_emotions.py
+"""
+Emotion Taxonomy
+Single source of the emotion labels used across expense schemas
+"""
+
+import sys
+from enum import Enum
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+
+class PrimaryEmotion(str, Enum):
+    HAPPY = "happy"
+    EXCITED = "excited"
+    STRESSED = "stressed"
+    ANXIOUS = "anxious"
+    BORED = "bored"
+    HUNGRY = "hungry"
+    TIRED = "tired"
+    SAD = "sad"
+    FRUSTRATED = "frustrated"
+    CELEBRATORY = "celebratory"
+    IMPULSIVE = "impulsive"
+    PLANNED = "planned"
+    GUILTY = "guilty"
+    NEUTRAL = "neutral"
+
+
+EMOTIONS: frozenset = frozenset(sys.intern(e.value) for e in PrimaryEmotion)
+
+
+def _validate_emotion(value: str) -> str:
+    """Check the label against the taxonomy and return the shared interned string"""
+    if value not in EMOTIONS:
+        raise ValueError(f"Unknown emotion '{value}'")
+    return sys.intern(value)
+
+
+Emotion = Annotated[str, AfterValidator(_validate_emotion)]
@@ -0,0 +1,13 @@
+# backend/app/schemas/_types.py
+"""
+Shared Constrained Types
+Reusable string aliases for schema fields
+"""
+
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+ShortStr = Annotated[str, StringConstraints(max_length=50)]
+Str255 = Annotated[str, StringConstraints(max_length=255)]
+Name255 = Annotated[str, StringConstraints(min_length=1, max_length=255)]
@@ -11,6 +11,8 @@ from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 
+from app.schemas._construct import RESPONSE_CONFIG
+
 
 class BudgetType(str, Enum):
     MONTHLY = "monthly"
@@ -61,8 +63,7 @@ class CategoryBudgetResponse(BaseModel):
     alert_at_percentage: int
     notes: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # ============================================
@@ -141,8 +142,7 @@ class BudgetResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class BudgetWithCategories(BudgetResponse):
@@ -185,8 +185,7 @@ class BudgetTemplateResponse(BaseModel):
     is_default: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # ============================================
@@ -205,8 +204,7 @@ class BudgetHistoryResponse(BaseModel):
     daily_spent: Decimal
     transaction_count: int
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class BudgetStats(BaseModel):
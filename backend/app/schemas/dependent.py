@@ -11,6 +11,8 @@ from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 
+from app.schemas._construct import RESPONSE_CONFIG
+
 
 # ============================================
 # ENUMS
@@ -83,8 +85,7 @@ class ExpenseTypeResponse(BaseModel):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # ============================================
@@ -232,8 +233,7 @@ class DependentExpenseResponse(BaseModel):
     
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # ============================================
@@ -330,8 +330,7 @@ class SharedCostResponse(BaseModel):
     total_remaining: float
     completion_percentage: float
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # ============================================
@@ -389,8 +388,7 @@ class DependentResponse(BaseModel):
     recent_expenses: List[DependentExpenseResponse] = []
     active_shared_costs: List[SharedCostResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class DependentSummary(BaseModel):
@@ -413,8 +411,7 @@ class DependentSummary(BaseModel):
     profile_image_url: Optional[str] = None
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # ============================================
@@ -455,8 +452,7 @@ class DependentMonthlySummaryResponse(BaseModel):
     vs_budget: Optional[Decimal] = None
     vs_last_month: Optional[Decimal] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class DependentCostProjection(BaseModel):
@@ -3,6 +3,8 @@ from datetime import datetime, date
 from uuid import UUID
 from typing import Optional, List
 
+from app.schemas._construct import FROZEN_RESPONSE_CONFIG
+
 # Expense Emotion Schemas
 class ExpenseEmotionBase(BaseModel):
     was_urgent: bool = False
@@ -36,8 +38,7 @@ class ExpenseEmotionResponse(ExpenseEmotionBase):
     created_at: datetime
     reflected_at: Optional[datetime]
     
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 # Daily Check-in Schemas
 class DailyCheckinResponse(BaseModel):
@@ -51,8 +52,7 @@ class DailyCheckinResponse(BaseModel):
     current_streak: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 # Spending Streak Schemas
 class SpendingStreakResponse(BaseModel):
@@ -5,12 +5,16 @@ Pydantic models for expenses, categories, and emotional tracking
 """
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
 
+from app.schemas._types import ShortStr, Str255, Name255
+from app.schemas._emotions import PrimaryEmotion, Emotion
+from app.schemas._construct import FROZEN_RESPONSE_CONFIG
+
 
 # ============================================
 # ENUMS
@@ -22,23 +26,6 @@ class CategoryType(str, Enum):
     DISCRETIONARY = "discretionary"
 
 
-class PrimaryEmotion(str, Enum):
-    HAPPY = "happy"
-    EXCITED = "excited"
-    STRESSED = "stressed"
-    ANXIOUS = "anxious"
-    BORED = "bored"
-    HUNGRY = "hungry"
-    TIRED = "tired"
-    SAD = "sad"
-    FRUSTRATED = "frustrated"
-    CELEBRATORY = "celebratory"
-    IMPULSIVE = "impulsive"
-    PLANNED = "planned"
-    GUILTY = "guilty"
-    NEUTRAL = "neutral"
-
-
 class TimeOfDay(str, Enum):
     MORNING = "morning"
     AFTERNOON = "afternoon"
@@ -77,7 +64,7 @@ class ExpenseCategoryCreate(BaseModel):
     category_type: CategoryType
     is_essential: bool = True
     monthly_budget: Optional[Decimal] = Field(None, ge=0)
-    icon: Optional[str] = Field(None, max_length=50)
+    icon: Optional[ShortStr] = None
     color: Optional[str] = Field(None, max_length=7)
 
 
@@ -88,7 +75,7 @@ class ExpenseCategoryUpdate(BaseModel):
     category_type: Optional[CategoryType] = None
     is_essential: Optional[bool] = None
     monthly_budget: Optional[Decimal] = Field(None, ge=0)
-    icon: Optional[str] = Field(None, max_length=50)
+    icon: Optional[ShortStr] = None
     color: Optional[str] = Field(None, max_length=7)
     is_active: Optional[bool] = None
 
@@ -108,8 +95,7 @@ class ExpenseCategoryResponse(BaseModel):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 # ============================================
@@ -135,7 +121,7 @@ class ExpenseEmotionCreate(BaseModel):
     time_of_day: Optional[TimeOfDay] = None
     day_type: Optional[DayType] = None
     stress_level: Optional[int] = Field(None, ge=1, le=10)
-    trigger_event: Optional[str] = Field(None, max_length=255)
+    trigger_event: Optional[Str255] = None
 
 
 class ExpenseEmotionReflection(BaseModel):
@@ -155,7 +141,7 @@ class ExpenseEmotionResponse(BaseModel):
     was_necessary: bool
     is_asset: bool
     
-    primary_emotion: str
+    primary_emotion: Emotion
     emotion_intensity: Optional[int] = None
     secondary_emotions: Optional[List[str]] = None
     
@@ -174,8 +160,7 @@ class ExpenseEmotionResponse(BaseModel):
     created_at: datetime
     reflected_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 # ============================================
@@ -184,7 +169,7 @@ class ExpenseEmotionResponse(BaseModel):
 
 class ExpenseCreate(BaseModel):
     """Create a new expense"""
-    expense_name: str = Field(..., min_length=1, max_length=255)
+    expense_name: Name255
     description: Optional[str] = None
     amount: Decimal = Field(..., ge=0)
     
@@ -193,8 +178,8 @@ class ExpenseCreate(BaseModel):
     expense_date: date
     expense_time: Optional[time] = None
     
-    merchant_name: Optional[str] = Field(None, max_length=255)
-    location: Optional[str] = Field(None, max_length=255)
+    merchant_name: Optional[Str255] = None
+    location: Optional[Str255] = None
     
     payment_method: Optional[PaymentMethod] = None
     
@@ -216,7 +201,7 @@ class ExpenseCreate(BaseModel):
 
 class ExpenseUpdate(BaseModel):
     """Update an expense"""
-    expense_name: Optional[str] = Field(None, min_length=1, max_length=255)
+    expense_name: Optional[Name255] = None
     description: Optional[str] = None
     amount: Optional[Decimal] = Field(None, ge=0)
     
@@ -225,8 +210,8 @@ class ExpenseUpdate(BaseModel):
     expense_date: Optional[date] = None
     expense_time: Optional[time] = None
     
-    merchant_name: Optional[str] = Field(None, max_length=255)
-    location: Optional[str] = Field(None, max_length=255)
+    merchant_name: Optional[Str255] = None
+    location: Optional[Str255] = None
     
     payment_method: Optional[PaymentMethod] = None
     
@@ -280,8 +265,7 @@ class ExpenseResponse(BaseModel):
     # Emotion if captured
     emotion: Optional[ExpenseEmotionResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 class ExpenseSummary(BaseModel):
@@ -293,10 +277,9 @@ class ExpenseSummary(BaseModel):
     category_name: Optional[str] = None
     merchant_name: Optional[str] = None
     has_emotion: bool = False
-    primary_emotion: Optional[str] = None
+    primary_emotion: Optional[Emotion] = None
 
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 # ============================================
@@ -305,7 +288,7 @@ class ExpenseSummary(BaseModel):
 
 class DailyCheckinCreate(BaseModel):
     """Start or update daily check-in"""
-    overall_mood: Optional[str] = Field(None, max_length=50)
+    overall_mood: Optional[ShortStr] = None
     mood_notes: Optional[str] = None
 
 
@@ -338,8 +321,7 @@ class DailyCheckinResponse(BaseModel):
     
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 # ============================================
@@ -360,8 +342,7 @@ class SpendingStreakResponse(BaseModel):
     target_streak: Optional[int] = None
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 # ============================================
@@ -370,17 +351,17 @@ class SpendingStreakResponse(BaseModel):
 
 class ExpenseStats(BaseModel):
     """Expense statistics"""
-    total_spent_today: Decimal
-    total_spent_this_week: Decimal
-    total_spent_this_month: Decimal
+    total_spent_today: float
+    total_spent_this_week: float
+    total_spent_this_month: float
     
-    daily_average: Decimal
+    daily_average: float
     
-    by_category: Dict[str, Decimal]
-    by_payment_method: Dict[str, Decimal]
+    by_category: Dict[str, float]
+    by_payment_method: Dict[str, float]
     
-    essential_spending: Decimal
-    discretionary_spending: Decimal
+    essential_spending: float
+    discretionary_spending: float
     
     expense_count_today: int
     expense_count_month: int
@@ -388,17 +369,17 @@ class ExpenseStats(BaseModel):
 
 class EmotionalSpendingStats(BaseModel):
     """Emotional spending analysis"""
-    total_emotional_spending: Decimal
+    total_emotional_spending: float
     emotional_spending_percentage: float
     
-    by_emotion: Dict[str, Decimal]
-    by_time_of_day: Dict[str, Decimal]
-    by_day_type: Dict[str, Decimal]
+    by_emotion: Dict[Emotion, float]
+    by_time_of_day: Dict[str, float]
+    by_day_type: Dict[str, float]
     
     average_stress_level: float
     average_regret_level: float
     
-    top_triggers: List[str]
+    top_triggers: Tuple[str, ...]
     highest_spending_emotion: str
     
     purchases_with_regret: int
@@ -410,15 +391,15 @@ class MonthlySpendingBreakdown(BaseModel):
     year: int
     month: int
     
-    total_spending: Decimal
-    by_category: Dict[str, Decimal]
-    by_week: Dict[str, Decimal]
+    total_spending: float
+    by_category: Dict[str, float]
+    by_week: Dict[str, float]
     
-    essential_total: Decimal
-    discretionary_total: Decimal
+    essential_total: float
+    discretionary_total: float
     
-    vs_budget: Optional[Decimal] = None
-    vs_last_month: Optional[Decimal] = None
+    vs_budget: Optional[float] = None
+    vs_last_month: Optional[float] = None
 
 
 # ============================================
@@ -435,31 +416,30 @@ class MonthlyAnalysisResponse(BaseModel):
     emotional_spending_amount: Decimal
     emotional_spending_percentage: Decimal
     
-    most_common_emotion: Optional[str] = None
-    most_expensive_emotion: Optional[str] = None
+    most_common_emotion: Optional[Emotion] = None
+    most_expensive_emotion: Optional[Emotion] = None
     
     highest_spending_time: Optional[str] = None
     highest_spending_day: Optional[str] = None
     
-    top_triggers: Optional[List[str]] = None
-    emotional_categories: Optional[List[str]] = None
+    top_triggers: Optional[Tuple[str, ...]] = None
+    emotional_categories: Optional[Tuple[str, ...]] = None
     
     ai_observations: Optional[str] = None
-    behavioral_recommendations: Optional[List[str]] = None
-    meal_suggestions: Optional[List[str]] = None
+    behavioral_recommendations: Optional[Tuple[str, ...]] = None
+    meal_suggestions: Optional[Tuple[str, ...]] = None
     
     vs_last_month_spending: Optional[Decimal] = None
     vs_last_month_emotional: Optional[Decimal] = None
     
     user_reflection: Optional[str] = None
-    action_items: Optional[List[str]] = None
+    action_items: Optional[Tuple[str, ...]] = None
     reflection_completed: bool
     reflection_completed_at: Optional[datetime] = None
     
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 class SubmitReflection(BaseModel):
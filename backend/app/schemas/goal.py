@@ -1,12 +1,18 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import date, datetime
 from uuid import UUID
-from typing import Optional, List
+from typing import Optional, List, Literal
 from decimal import Decimal
 
+from app.schemas._types import Name255
+from app.schemas._construct import RESPONSE_CONFIG
+
+GoalType = Literal["savings", "debt_payoff", "purchase", "emergency_fund", "education", "investment"]
+GoalStatus = Literal["active", "completed", "paused", "cancelled"]
+
 # Milestone Schemas
 class GoalMilestoneBase(BaseModel):
-    milestone_name: str = Field(..., min_length=1, max_length=255)
+    milestone_name: Name255
     target_amount: Decimal = Field(..., gt=0)
     target_date: date
 
@@ -20,8 +26,7 @@ class GoalMilestoneResponse(GoalMilestoneBase):
     achieved_date: Optional[date]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 # Progress History Schemas
 class GoalProgressCreate(BaseModel):
@@ -41,13 +46,12 @@ class GoalProgressResponse(BaseModel):
     notes: Optional[str]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 # Goal Schemas
 class FinancialGoalBase(BaseModel):
-    goal_name: str = Field(..., min_length=1, max_length=255)
-    goal_type: str = Field(..., pattern="^(savings|debt_payoff|purchase|emergency_fund|education|investment)$")
+    goal_name: Name255
+    goal_type: GoalType
     target_amount: Decimal = Field(..., gt=0)
     current_amount: Decimal = Field(default=0, ge=0)
     deadline_date: Optional[date] = None
@@ -64,7 +68,7 @@ class FinancialGoalUpdate(BaseModel):
     deadline_date: Optional[date] = None
     priority_level: Optional[int] = Field(None, ge=1, le=10)
     monthly_allocation: Optional[Decimal] = None
-    status: Optional[str] = Field(None, pattern="^(active|completed|paused|cancelled)$")
+    status: Optional[GoalStatus] = None
 
 class FinancialGoalResponse(FinancialGoalBase):
     goal_id: UUID
@@ -80,9 +84,12 @@ class FinancialGoalResponse(FinancialGoalBase):
     days_remaining: Optional[int] = None
     required_monthly_savings: Optional[float] = None
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 class FinancialGoalWithDetails(FinancialGoalResponse):
     milestones: List[GoalMilestoneResponse] = []
-    recent_progress: List[GoalProgressResponse] = []
\ No newline at end of file
+    recent_progress: List[GoalProgressResponse] = []
+
+# List adapters, built once and reused for goal detail responses
+MILESTONES_ADAPTER = TypeAdapter(List[GoalMilestoneResponse])
+PROGRESS_ADAPTER = TypeAdapter(List[GoalProgressResponse])
\ No newline at end of file
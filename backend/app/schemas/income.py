@@ -4,13 +4,16 @@ Income Schemas
 Pydantic models for income sources and history API
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, List, Dict, Annotated
 from uuid import UUID
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 
+from app.schemas._types import ShortStr, Str255, Name255
+from app.schemas._construct import FROZEN_RESPONSE_CONFIG
+
 
 # ============================================
 # ENUMS
@@ -50,15 +53,24 @@ class TaxWithholdingType(str, Enum):
     NONE = "none"
 
 
+# ============================================
+# CONSTRAINED TYPES
+# ============================================
+
+TaxRatePct = Annotated[Decimal, Field(ge=0, le=100)]
+HoursPerWeek = Annotated[int, Field(ge=1, le=168)]
+ReliabilityScore = Annotated[Decimal, Field(ge=0, le=1)]
+
+
 # ============================================
 # CREATE/UPDATE SCHEMAS
 # ============================================
 
 class IncomeSourceCreate(BaseModel):
     """Create a new income source"""
-    source_name: str = Field(..., min_length=1, max_length=255)
+    source_name: Name255
     source_type: IncomeSourceType
-    employer_name: Optional[str] = Field(None, max_length=255)
+    employer_name: Optional[Str255] = None
     description: Optional[str] = None
     
     # Pay structure
@@ -72,20 +84,20 @@ class IncomeSourceCreate(BaseModel):
     next_payment_date: Optional[date] = None
     
     # Work constraints
-    max_hours_per_week: Optional[int] = Field(None, ge=1, le=168)
+    max_hours_per_week: Optional[HoursPerWeek] = None
     expected_hours_per_period: Optional[Decimal] = Field(None, ge=0)
     
     # Tax
     is_taxable: bool = True
-    tax_rate_federal: Optional[Decimal] = Field(None, ge=0, le=100)
-    tax_rate_state: Optional[Decimal] = Field(None, ge=0, le=100)
-    tax_rate_local: Optional[Decimal] = Field(None, ge=0, le=100)
-    tax_rate_fica: Optional[Decimal] = Field(7.65, ge=0, le=100)
+    tax_rate_federal: Optional[TaxRatePct] = None
+    tax_rate_state: Optional[TaxRatePct] = None
+    tax_rate_local: Optional[TaxRatePct] = None
+    tax_rate_fica: Optional[TaxRatePct] = Decimal('7.65')
     tax_withholding_type: TaxWithholdingType = TaxWithholdingType.W2
     
     # Reliability
     is_guaranteed: bool = True
-    reliability_score: Decimal = Field(1.0, ge=0, le=1)
+    reliability_score: ReliabilityScore = Decimal('1.0')
     
     # Dates
     start_date: Optional[date] = None
@@ -93,18 +105,18 @@ class IncomeSourceCreate(BaseModel):
     
     notes: Optional[str] = None
     
-    @field_validator('pay_rate', 'fixed_amount')
-    @classmethod
-    def validate_pay_info(cls, v, info):
-        # At least one of pay_rate or fixed_amount should be provided
-        return v
+    @model_validator(mode='after')
+    def validate_pay_info(self):
+        if self.pay_rate is None and self.fixed_amount is None:
+            raise ValueError('Either pay_rate or fixed_amount is required')
+        return self
 
 
 class IncomeSourceUpdate(BaseModel):
     """Update an income source"""
-    source_name: Optional[str] = Field(None, min_length=1, max_length=255)
+    source_name: Optional[Name255] = None
     source_type: Optional[IncomeSourceType] = None
-    employer_name: Optional[str] = Field(None, max_length=255)
+    employer_name: Optional[Str255] = None
     description: Optional[str] = None
     
     pay_structure: Optional[PayStructure] = None
@@ -115,18 +127,18 @@ class IncomeSourceUpdate(BaseModel):
     frequency: Optional[PaymentFrequency] = None
     next_payment_date: Optional[date] = None
     
-    max_hours_per_week: Optional[int] = Field(None, ge=1, le=168)
+    max_hours_per_week: Optional[HoursPerWeek] = None
     expected_hours_per_period: Optional[Decimal] = Field(None, ge=0)
     
     is_taxable: Optional[bool] = None
-    tax_rate_federal: Optional[Decimal] = Field(None, ge=0, le=100)
-    tax_rate_state: Optional[Decimal] = Field(None, ge=0, le=100)
-    tax_rate_local: Optional[Decimal] = Field(None, ge=0, le=100)
-    tax_rate_fica: Optional[Decimal] = Field(None, ge=0, le=100)
+    tax_rate_federal: Optional[TaxRatePct] = None
+    tax_rate_state: Optional[TaxRatePct] = None
+    tax_rate_local: Optional[TaxRatePct] = None
+    tax_rate_fica: Optional[TaxRatePct] = None
     tax_withholding_type: Optional[TaxWithholdingType] = None
     
     is_guaranteed: Optional[bool] = None
-    reliability_score: Optional[Decimal] = Field(None, ge=0, le=1)
+    reliability_score: Optional[ReliabilityScore] = None
     
     start_date: Optional[date] = None
     end_date: Optional[date] = None
@@ -162,7 +174,7 @@ class LogIncomeRequest(BaseModel):
     payment_date: date
     payment_period_start: Optional[date] = None
     payment_period_end: Optional[date] = None
-    payment_method: Optional[str] = Field(None, max_length=50)
+    payment_method: Optional[ShortStr] = None
     
     notes: Optional[str] = None
     
@@ -206,8 +218,7 @@ class IncomeHistoryResponse(BaseModel):
     notes: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 # ============================================
@@ -264,8 +275,7 @@ class IncomeSourceResponse(BaseModel):
     # Recent history
     recent_payments: List[IncomeHistoryResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 class IncomeSourceSummary(BaseModel):
@@ -283,8 +293,7 @@ class IncomeSourceSummary(BaseModel):
     is_guaranteed: bool
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 # ============================================
@@ -293,20 +302,20 @@ class IncomeSourceSummary(BaseModel):
 
 class IncomeStats(BaseModel):
     """Income statistics"""
-    total_monthly_gross: Decimal
-    total_monthly_net: Decimal
-    total_annual_gross: Decimal
-    total_annual_net: Decimal
+    total_monthly_gross: float
+    total_monthly_net: float
+    total_annual_gross: float
+    total_annual_net: float
     
-    guaranteed_monthly: Decimal
-    variable_monthly: Decimal
+    guaranteed_monthly: float
+    variable_monthly: float
     
     active_sources_count: int
     
     average_effective_tax_rate: float
     
-    by_type: dict  # {"job": 2000, "scholarship": 7900}
-    by_source: dict  # {"IT Job": 1000, "Engineering Pathways": 500}
+    by_type: Dict[str, float]  # {"job": 2000, "scholarship": 7900}
+    by_source: Dict[str, float]  # {"IT Job": 1000, "Engineering Pathways": 500}
 
 
 class MonthlyIncomeBreakdown(BaseModel):
@@ -314,14 +323,14 @@ class MonthlyIncomeBreakdown(BaseModel):
     year: int
     month: int
     
-    total_gross: Decimal
-    total_net: Decimal
-    total_taxes: Decimal
+    total_gross: float
+    total_net: float
+    total_taxes: float
     
-    by_source: dict
+    by_source: Dict[str, float]
     
-    vs_last_month: Optional[Decimal] = None
-    vs_expected: Optional[Decimal] = None
+    vs_last_month: Optional[float] = None
+    vs_expected: Optional[float] = None
 
 
 # ============================================
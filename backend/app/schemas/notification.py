@@ -5,11 +5,14 @@ Pydantic models for notifications, reminders, and achievements
 """
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, Union, Annotated
 from uuid import UUID
 from datetime import date, datetime, time
 from enum import Enum
 
+from app.schemas._types import Name255
+from app.schemas._construct import FROZEN_RESPONSE_CONFIG
+
 
 class NotificationType(str, Enum):
     BUDGET_ALERT = "budget_alert"
@@ -55,19 +58,47 @@ class ReminderType(str, Enum):
     MONTHLY_REVIEW = "monthly_review"
 
 
+# ============================================
+# ACTION PAYLOADS
+# ============================================
+
+class BudgetAlertPayload(BaseModel):
+    """Action data for budget alerts"""
+    notification_type: Literal["budget_alert"] = "budget_alert"
+    budget_id: UUID
+
+
+class GoalMilestonePayload(BaseModel):
+    """Action data for goal milestones"""
+    notification_type: Literal["goal_milestone"] = "goal_milestone"
+    goal_id: UUID
+
+
+class AchievementPayload(BaseModel):
+    """Action data for unlocked achievements"""
+    notification_type: Literal["achievement"] = "achievement"
+    achievement_id: UUID
+
+
+ActionPayload = Annotated[
+    Union[BudgetAlertPayload, GoalMilestonePayload, AchievementPayload],
+    Field(discriminator="notification_type")
+]
+
+
 # ============================================
 # NOTIFICATION SCHEMAS
 # ============================================
 
 class NotificationCreate(BaseModel):
     """Create a notification (internal use)"""
-    title: str = Field(..., min_length=1, max_length=255)
+    title: Name255
     message: str
     notification_type: NotificationType
     priority: NotificationPriority = NotificationPriority.NORMAL
     category: Optional[NotificationCategory] = None
     action_type: Optional[str] = None
-    action_data: Optional[Dict[str, Any]] = None
+    action_data: Optional[ActionPayload] = None
     scheduled_for: Optional[datetime] = None
     expires_at: Optional[datetime] = None
 
@@ -87,8 +118,7 @@ class NotificationResponse(BaseModel):
     read_at: Optional[datetime] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 class NotificationUpdate(BaseModel):
@@ -113,7 +143,7 @@ class NotificationList(BaseModel):
 class ReminderCreate(BaseModel):
     """Create a reminder"""
     reminder_type: ReminderType
-    title: str = Field(..., min_length=1, max_length=255)
+    title: Name255
     message: Optional[str] = None
     frequency: ReminderFrequency
     time_of_day: time
@@ -140,7 +170,7 @@ class ReminderCreate(BaseModel):
 
 class ReminderUpdate(BaseModel):
     """Update a reminder"""
-    title: Optional[str] = Field(None, min_length=1, max_length=255)
+    title: Optional[Name255] = None
     message: Optional[str] = None
     time_of_day: Optional[time] = None
     days_of_week: Optional[List[int]] = None
@@ -167,8 +197,7 @@ class ReminderResponse(BaseModel):
     next_scheduled_at: Optional[datetime] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 class SnoozeReminderRequest(BaseModel):
@@ -226,8 +255,7 @@ class NotificationPreferenceResponse(BaseModel):
     email_enabled: bool
     email_frequency: str
     
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 # ============================================
@@ -245,8 +273,7 @@ class AchievementResponse(BaseModel):
     requirement_value: int
     points: int
     
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 class UserAchievementResponse(BaseModel):
@@ -257,8 +284,7 @@ class UserAchievementResponse(BaseModel):
     current_progress: int
     target_progress: Optional[int] = None
     
-    class Config:
-        from_attributes = True
+    model_config = FROZEN_RESPONSE_CONFIG
 
 
 class AchievementProgress(BaseModel):
@@ -4,13 +4,16 @@ Recurring Expense Schemas
 Pydantic models for API request/response validation
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, List, Dict
+from typing_extensions import NotRequired, TypedDict
 from uuid import UUID
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 
+from app.schemas._construct import RESPONSE_CONFIG, struct_from_model
+
 
 # ============================================
 # ENUMS
@@ -92,21 +95,14 @@ class RecurringExpenseCreate(BaseModel):
     notes: Optional[str] = None
     tags: Optional[List[str]] = None
     
-    @field_validator('max_amount')
-    @classmethod
-    def max_must_be_greater_than_min(cls, v, info):
-        if v is not None and info.data.get('min_amount') is not None:
-            if v < info.data['min_amount']:
+    @model_validator(mode='after')
+    def validate_ranges(self):
+        if self.min_amount is not None and self.max_amount is not None:
+            if self.max_amount < self.min_amount:
                 raise ValueError('max_amount must be >= min_amount')
-        return v
-    
-    @field_validator('end_date')
-    @classmethod
-    def end_must_be_after_start(cls, v, info):
-        if v is not None and info.data.get('start_date') is not None:
-            if v < info.data['start_date']:
-                raise ValueError('end_date must be >= start_date')
-        return v
+        if self.end_date is not None and self.end_date < self.start_date:
+            raise ValueError('end_date must be >= start_date')
+        return self
 
 
 class RecurringExpenseUpdate(BaseModel):
@@ -187,8 +183,7 @@ class PaymentHistoryResponse(BaseModel):
     notes: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 # ============================================
@@ -252,8 +247,7 @@ class RecurringExpenseResponse(BaseModel):
     # Recent history
     recent_payments: List[PaymentHistoryResponse] = []
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class RecurringExpenseSummary(BaseModel):
@@ -276,8 +270,7 @@ class RecurringExpenseSummary(BaseModel):
     
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class UpcomingBillResponse(BaseModel):
@@ -296,8 +289,19 @@ class UpcomingBillResponse(BaseModel):
     is_essential: bool
     auto_pay: bool
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
+
+
+# ============================================
+# LIST STRUCTS
+# ============================================
+# msgspec twins of the list-view responses above, generated from them.
+# List endpoints encode these directly with MsgspecJSONResponse; the
+# Pydantic models stay as the documented response_model.
+
+PaymentHistoryStruct = struct_from_model(PaymentHistoryResponse, "PaymentHistoryStruct")
+RecurringExpenseSummaryStruct = struct_from_model(RecurringExpenseSummary, "RecurringExpenseSummaryStruct")
+UpcomingBillStruct = struct_from_model(UpcomingBillResponse, "UpcomingBillStruct")
 
 
 # ============================================
@@ -306,11 +310,11 @@ class UpcomingBillResponse(BaseModel):
 
 class RecurringExpenseStats(BaseModel):
     """Statistics for recurring expenses"""
-    total_monthly_recurring: Decimal
-    total_annual_recurring: Decimal
+    total_monthly_recurring: float
+    total_annual_recurring: float
     
-    essential_monthly: Decimal
-    discretionary_monthly: Decimal
+    essential_monthly: float
+    discretionary_monthly: float
     
     total_active_expenses: int
     bills_count: int
@@ -326,12 +330,12 @@ class MonthlyRecurringBreakdown(BaseModel):
     """Monthly breakdown by category/type"""
     month: str  # "2025-01"
     
-    by_type: dict  # {"subscription": 50.00, "utility": 150.00}
-    by_category: dict  # {"Entertainment": 50.00, "Housing": 150.00}
+    by_type: Dict[str, float]  # {"subscription": 50.00, "utility": 150.00}
+    by_category: Dict[str, float]  # {"Entertainment": 50.00, "Housing": 150.00}
     
-    total: Decimal
-    essential_total: Decimal
-    discretionary_total: Decimal
+    total: float
+    essential_total: float
+    discretionary_total: float
 
 
 class VariableExpenseAnalysis(BaseModel):
@@ -339,10 +343,10 @@ class VariableExpenseAnalysis(BaseModel):
     recurring_id: UUID
     expense_name: str
     
-    avg_amount: Decimal
-    min_recorded: Decimal
-    max_recorded: Decimal
-    std_deviation: Decimal
+    avg_amount: float
+    min_recorded: float
+    max_recorded: float
+    std_deviation: float
     
     trend: str  # "increasing", "decreasing", "stable"
     trend_percentage: float
@@ -352,13 +356,33 @@ class VariableExpenseAnalysis(BaseModel):
     payment_count: int
 
 
+# ============================================
+# ANALYTICS STRUCTS
+# ============================================
+# msgspec twins of the analytics schemas above, generated from them.
+# The service returns these and the routes encode them with
+# MsgspecJSONResponse.
+
+RecurringExpenseStatsStruct = struct_from_model(RecurringExpenseStats, "RecurringExpenseStatsStruct")
+MonthlyRecurringBreakdownStruct = struct_from_model(MonthlyRecurringBreakdown, "MonthlyRecurringBreakdownStruct")
+VariableExpenseAnalysisStruct = struct_from_model(VariableExpenseAnalysis, "VariableExpenseAnalysisStruct")
+
+
 # ============================================
 # BULK OPERATIONS
 # ============================================
 
+class BulkPaymentItem(TypedDict):
+    """Single payment row in a bulk payment request"""
+    recurring_id: UUID
+    amount_paid: Decimal
+    payment_date: date
+    payment_method: NotRequired[PaymentMethod]
+
+
 class BulkRecordPayments(BaseModel):
     """Record payments for multiple recurring expenses"""
-    payments: List[dict]  # [{"recurring_id": UUID, "amount_paid": Decimal, "payment_date": date}]
+    payments: List[BulkPaymentItem]
     default_payment_method: Optional[PaymentMethod] = None
 
 
@@ -3,6 +3,8 @@ from datetime import date, datetime
 from uuid import UUID
 from typing import Optional
 
+from app.schemas._construct import RESPONSE_CONFIG
+
 class UserBase(BaseModel):
     email: EmailStr
     full_name: str = Field(..., min_length=1, max_length=255)
@@ -26,8 +28,7 @@ class UserResponse(UserBase):
     created_at: datetime
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 class Token(BaseModel):
     access_token: str
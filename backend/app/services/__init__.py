@@ -0,0 +1,2 @@
+# backend/app/services/__init__.py
+"""Business logic services"""
@@ -5,12 +5,16 @@ Integration layer for all AI models
 Provides unified interface for predictions and insights
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Hashable, TypeVar
 from datetime import date, datetime, timedelta
 from uuid import UUID
+import asyncio
+import copy
+import hashlib
 import logging
 import os
 
+import pandas as pd
 from sqlalchemy.orm import Session
 
 from app.ai_models.predictors.spending_predictor import SpendingPredictor
@@ -18,10 +22,41 @@ from app.ai_models.predictors.goal_scorer import GoalAchievementScorer
 from app.ai_models.analyzers.anomaly_detector import AnomalyDetector
 from app.ai_models.analyzers.emotional_analyzer import EmotionalPatternAnalyzer
 from app.ai_models.utils.data_preprocessor import DataPreprocessor
+from app.database import run_in_session
 from app.config import settings
+from app.core.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Trained models shared across requests: one slot per (kind, user) holding
+# the model and the fingerprint of the data it was fitted on. A refit on new
+# data replaces the slot, so stale models are not kept around; entries also
+# expire after an hour and the slot count is capped.
+# AIService is built per request, so without this every call retrains.
+_model_cache = TTLCache(maxsize=256, ttl=3600)
+
+
+def _frame_key(df: pd.DataFrame) -> str:
+    """Short fingerprint of a DataFrame's contents."""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=8).hexdigest()
+
+
+def _cached_model(slot: Hashable, fingerprint: Hashable, build: Callable[[], T]) -> T:
+    """
+    Return the model cached in slot if it was fitted on data matching
+    fingerprint; otherwise train it with build() and replace the slot.
+    """
+    cached = _model_cache.get(slot)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    model = build()
+    _model_cache.set(slot, (fingerprint, model))
+    return model
+
 
 class AIService:
     """
@@ -94,8 +129,15 @@ class AIService:
         
         # Train model on user data if not already trained
         if not self.spending_predictor.is_trained:
+            def build() -> SpendingPredictor:
+                predictor = SpendingPredictor()
+                predictor.train(daily_df)
+                return predictor
+            
             try:
-                self.spending_predictor.train(daily_df)
+                self.spending_predictor = _cached_model(
+                    ('spending', user_id), _frame_key(daily_df), build
+                )
             except Exception as e:
                 logger.error(f"Error training spending predictor: {e}")
                 return {'status': 'error', 'message': str(e)}
@@ -163,12 +205,9 @@ class AIService:
         spending_data = self._get_spending_context(user_id)
         
         # Ensure model is trained
-        if not self.goal_scorer.is_trained:
-            try:
-                self.goal_scorer.train_with_synthetic()
-            except Exception as e:
-                logger.error(f"Error training goal scorer: {e}")
-                return {'status': 'error', 'message': str(e)}
+        error = self._ensure_goal_scorer()
+        if error:
+            return error
         
         # Score goal
         try:
@@ -180,7 +219,7 @@ class AIService:
             return {'status': 'error', 'message': str(e)}
     
     def score_all_goals(self, user_id: UUID) -> List[Dict[str, Any]]:
-        """Score all user's active goals."""
+        """Score all user's active goals in one batch."""
         goals_df = self.preprocessor.get_user_goals(user_id)
         
         if goals_df.empty:
@@ -189,15 +228,54 @@ class AIService:
         # Filter to active goals
         active_goals = goals_df[goals_df['status'] == 'active']
         
-        results = []
-        for _, goal in active_goals.iterrows():
-            goal_data = goal.to_dict()
-            score = self.score_goal(user_id, goal_data)
+        if active_goals.empty:
+            return []
+        
+        columns = list(active_goals.columns)
+        goals = [
+            dict(zip(columns, row))
+            for row in active_goals.itertuples(index=False, name=None)
+        ]
+        
+        # User context is the same for every goal
+        income_data = self._get_income_context(user_id)
+        spending_data = self._get_spending_context(user_id)
+        
+        error = self._ensure_goal_scorer()
+        if error:
+            scores = [dict(error) for _ in goals]
+        else:
+            try:
+                scores = self.goal_scorer.batch_score(goals, income_data, spending_data)
+                for score in scores:
+                    score['status'] = 'success'
+            except Exception as e:
+                logger.error(f"Error scoring goals: {e}")
+                scores = [{'status': 'error', 'message': str(e)} for _ in goals]
+        
+        for goal_data, score in zip(goals, scores):
             score['goal_id'] = goal_data.get('goal_id')
             score['goal_name'] = goal_data.get('goal_name')
-            results.append(score)
         
-        return results
+        return scores
+    
+    def _ensure_goal_scorer(self) -> Optional[Dict[str, Any]]:
+        """Train (or fetch the cached) goal scorer. Returns an error dict on failure."""
+        if self.goal_scorer.is_trained:
+            return None
+        
+        def build() -> GoalAchievementScorer:
+            scorer = GoalAchievementScorer()
+            scorer.train_with_synthetic()
+            return scorer
+        
+        try:
+            # Synthetic training data is the same for every user
+            self.goal_scorer = _cached_model(('goal_scorer',), None, build)
+        except Exception as e:
+            logger.error(f"Error training goal scorer: {e}")
+            return {'status': 'error', 'message': str(e)}
+        return None
     
     def _get_income_context(self, user_id: UUID) -> Dict:
         """Get user's income context for scoring."""
@@ -206,9 +284,8 @@ class AIService:
         if income_df.empty:
             return {}
         
-        monthly = income_df.groupby(
-            income_df['payment_date'].apply(lambda x: x.strftime('%Y-%m'))
-        )['net_amount'].sum()
+        months = pd.to_datetime(income_df['payment_date']).dt.to_period('M')
+        monthly = income_df.groupby(months)['net_amount'].sum()
         
         return {
             'avg_monthly': float(monthly.mean()) if len(monthly) > 0 else 0,
@@ -255,7 +332,11 @@ class AIService:
             }
         
         # Fit detector on recent data
-        self.anomaly_detector.fit(expenses_df)
+        self.anomaly_detector = _cached_model(
+            ('anomaly', user_id),
+            _frame_key(expenses_df),
+            lambda: AnomalyDetector().fit(expenses_df)
+        )
         
         # Get anomaly summary
         summary = self.anomaly_detector.get_anomaly_summary(expenses_df)
@@ -270,13 +351,13 @@ class AIService:
         expense_date: date
     ) -> Dict[str, Any]:
         """Quick check if today's spending is anomalous."""
-        # Ensure detector is fitted
-        expenses_df = self.preprocessor.get_user_expenses(user_id, days_back=90)
+        def build() -> AnomalyDetector:
+            expenses_df = self.preprocessor.get_user_expenses(user_id, days_back=90)
+            return AnomalyDetector().fit(expenses_df)
         
-        if expenses_df.empty:
-            return {'is_anomaly': False, 'reason': 'No baseline data'}
-        
-        self.anomaly_detector.fit(expenses_df)
+        # The 90-day baseline is fetched and fitted at most once a day per user.
+        # With no history the detector has no stats and reports no baseline.
+        self.anomaly_detector = _cached_model(('daily_anomaly', user_id), date.today(), build)
         return self.anomaly_detector.detect_daily_anomaly(daily_total, expense_date)
     
     # ============================================
@@ -334,13 +415,21 @@ class AIService:
     # COMPREHENSIVE INSIGHTS
     # ============================================
     
-    def get_dashboard_insights(self, user_id: UUID) -> Dict[str, Any]:
+    async def get_dashboard_insights(
+        self,
+        user_id: UUID,
+        now_iso: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Get all insights for the user dashboard.
         Combines all AI analyses into a single response.
+        
+        Expenses are fetched once up front. The four analyses are
+        independent, so they run concurrently on the shared parallel-read
+        workers (see app.database.run_in_session), each with its own session.
         """
         insights = {
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now_iso or datetime.utcnow().isoformat(timespec='seconds'),
             'spending_prediction': None,
             'goal_scores': None,
             'anomalies': None,
@@ -349,29 +438,26 @@ class AIService:
             'quick_stats': {},
         }
         
-        # Spending prediction
-        try:
-            insights['spending_prediction'] = self.predict_weekly_spending(user_id)
-        except Exception as e:
-            logger.error(f"Dashboard spending prediction error: {e}")
-        
-        # Goal scores
+        # One 90-day expense fetch covers every analysis below
         try:
-            insights['goal_scores'] = self.score_all_goals(user_id)
+            await asyncio.to_thread(self.preprocessor.preload, user_id, 90)
         except Exception as e:
-            logger.error(f"Dashboard goal scoring error: {e}")
-        
-        # Anomalies
-        try:
-            insights['anomalies'] = self.detect_anomalies(user_id, days_back=7)
-        except Exception as e:
-            logger.error(f"Dashboard anomaly detection error: {e}")
-        
-        # Emotional analysis
-        try:
-            insights['emotional_analysis'] = self.analyze_emotional_patterns(user_id, days_back=30)
-        except Exception as e:
-            logger.error(f"Dashboard emotional analysis error: {e}")
+            logger.error(f"Dashboard expense preload error: {e}")
+        
+        # (insights key, analysis run against an isolated service copy)
+        tasks = (
+            ('spending_prediction', lambda ai: ai.predict_weekly_spending(user_id)),
+            ('goal_scores', lambda ai: ai.score_all_goals(user_id)),
+            ('anomalies', lambda ai: ai.detect_anomalies(user_id, days_back=7)),
+            ('emotional_analysis', lambda ai: ai.analyze_emotional_patterns(user_id, days_back=30)),
+        )
+        bind = self.db.get_bind()
+        results = await asyncio.gather(*(
+            run_in_session(bind, lambda db, key=key, analysis=analysis: self._run_isolated(key, analysis, db))
+            for key, analysis in tasks
+        ))
+        for (key, _), result in zip(tasks, results):
+            insights[key] = result
         
         # Generate alerts
         insights['alerts'] = self._generate_alerts(insights)
@@ -381,6 +467,26 @@ class AIService:
         
         return insights
     
+    def _run_isolated(
+        self,
+        label: str,
+        analysis: Callable[['AIService'], T],
+        db: Session
+    ) -> Optional[T]:
+        """
+        Run one dashboard analysis on a copy of this service bound to the
+        worker's session (Sessions are not thread-safe). Models are shared.
+        Errors are logged and reported as None.
+        """
+        try:
+            worker = copy.copy(self)
+            worker.db = db
+            worker.preprocessor = self.preprocessor.with_session(db)
+            return analysis(worker)
+        except Exception as e:
+            logger.error(f"Dashboard {label} error: {e}")
+            return None
+    
     def _generate_alerts(self, insights: Dict) -> List[Dict]:
         """Generate alerts from insights."""
         alerts = []
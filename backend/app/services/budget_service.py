@@ -4,13 +4,15 @@ Budget Service
 Business logic for budget management
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, extract
+from sqlalchemy.orm import Session, selectinload, raiseload
+from sqlalchemy import and_, case, func, extract, update, select
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-import json
+from calendar import monthrange
+from functools import lru_cache
 
 from app.models.budget import Budget, CategoryBudget, BudgetHistory, BudgetTemplate
 from app.models.expense import Expense, ExpenseCategory
@@ -19,6 +21,36 @@ from app.schemas.budget import (
     BudgetTemplateCreate, QuickBudgetCreate, ApplyTemplateRequest
 )
 from app.core.exceptions import NotFoundError, ValidationError
+from app.core.cache import invalidate_dashboard
+from app.services.notification_service import NotificationService
+from app.config import settings
+
+
+def _with_categories() -> tuple:
+    """Loader options for budgets whose category budgets will be read"""
+    options = (selectinload(Budget.category_budgets),)
+    if settings.RAISE_ON_LAZY_LOAD:
+        options += (raiseload('*'),)
+    return options
+
+
+# Alert threshold (percent of the limit) when a budget row has none set
+_DEFAULT_ALERT_PERCENTAGE = 80
+
+
+# SQLSTATE for exclusion_violation (no_overlap_active_budget)
+_EXCLUSION_VIOLATION = '23P01'
+
+
+def _is_overlap_violation(exc: IntegrityError) -> bool:
+    """Whether an IntegrityError came from the active-budget overlap constraint"""
+    return getattr(exc.orig, 'pgcode', None) == _EXCLUSION_VIOLATION
+
+
+@lru_cache(maxsize=512)
+def _month_end(year: int, month: int) -> date:
+    """Last day of the given month"""
+    return date(year, month, monthrange(year, month)[1])
 
 
 class BudgetService:
@@ -34,18 +66,6 @@ class BudgetService:
     def create_budget(self, user_id: UUID, data: BudgetCreate) -> Budget:
         """Create a new budget"""
         
-        # Check for overlapping budgets
-        existing = self.db.query(Budget).filter(
-            Budget.user_id == user_id,
-            Budget.budget_type == data.budget_type,
-            Budget.status == 'active',
-            Budget.start_date <= data.end_date,
-            Budget.end_date >= data.start_date
-        ).first()
-        
-        if existing:
-            raise ValidationError(f"Overlapping {data.budget_type} budget exists for this period")
-        
         budget = Budget(
             user_id=user_id,
             budget_name=data.budget_name,
@@ -62,24 +82,43 @@ class BudgetService:
         )
         
         self.db.add(budget)
-        self.db.flush()  # Get the budget_id
         
-        # Create category budgets if provided
+        # Overlapping active budgets are rejected by no_overlap_active_budget
+        try:
+            self.db.flush()  # Get the budget_id
+        except IntegrityError as e:
+            self.db.rollback()
+            if _is_overlap_violation(e):
+                raise ValidationError(f"Overlapping {data.budget_type} budget exists for this period")
+            raise
+        
+        # Create category budgets if provided (single multi-row INSERT)
         if data.category_budgets:
-            for cat_budget in data.category_budgets:
-                self._create_category_budget(budget.budget_id, cat_budget)
+            mappings = [
+                {
+                    'budget_id': budget.budget_id,
+                    'category_id': cb.category_id,
+                    'allocated_amount': cb.allocated_amount,
+                    'is_flexible': cb.is_flexible,
+                    'priority': cb.priority,
+                    'notes': cb.notes,
+                }
+                for cb in data.category_budgets
+            ]
+            self.db.bulk_insert_mappings(CategoryBudget, mappings)
             
             # Update allocated amount
-            budget.allocated_amount = sum(cb.allocated_amount for cb in data.category_budgets)
+            self._sync_allocated_amount(budget.budget_id)
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(budget)
         
         return budget
     
     def get_budget(self, user_id: UUID, budget_id: UUID) -> Budget:
         """Get a specific budget"""
-        budget = self.db.query(Budget).filter(
+        budget = self.db.query(Budget).options(*_with_categories()).filter(
             Budget.budget_id == budget_id,
             Budget.user_id == user_id
         ).first()
@@ -99,6 +138,9 @@ class BudgetService:
         """Get all budgets for a user"""
         query = self.db.query(Budget).filter(Budget.user_id == user_id)
         
+        if include_categories:
+            query = query.options(*_with_categories())
+        
         if status:
             query = query.filter(Budget.status == status)
         
@@ -107,11 +149,20 @@ class BudgetService:
         
         return query.order_by(Budget.start_date.desc()).all()
     
-    def get_active_budget(self, user_id: UUID, budget_type: str = "monthly") -> Optional[Budget]:
+    def get_active_budget(
+        self,
+        user_id: UUID,
+        budget_type: str = "monthly",
+        include_categories: bool = True
+    ) -> Optional[Budget]:
         """Get the currently active budget"""
         today = date.today()
         
-        return self.db.query(Budget).filter(
+        query = self.db.query(Budget)
+        if include_categories:
+            query = query.options(*_with_categories())
+        
+        return query.filter(
             Budget.user_id == user_id,
             Budget.budget_type == budget_type,
             Budget.status == 'active',
@@ -121,21 +172,45 @@ class BudgetService:
     
     def update_budget(self, user_id: UUID, budget_id: UUID, data: BudgetUpdate) -> Budget:
         """Update a budget"""
-        budget = self.get_budget(user_id, budget_id)
+        values = {field: getattr(data, field) for field in data.model_fields_set}
+        if not values:
+            return self.get_budget(user_id, budget_id)
+        
+        # Ownership check and write in one statement
+        try:
+            budget = self.db.execute(
+                update(Budget)
+                .where(Budget.budget_id == budget_id, Budget.user_id == user_id)
+                .values(**values)
+                .returning(Budget)
+            ).scalars().first()
+        except IntegrityError as e:
+            self.db.rollback()
+            if _is_overlap_violation(e):
+                raise ValidationError("Budget would overlap another active budget")
+            raise
         
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(budget, field, value)
+        if not budget:
+            raise NotFoundError("Budget not found")
         
         self.db.commit()
-        self.db.refresh(budget)
+        invalidate_dashboard(user_id)
         
         return budget
     
     def delete_budget(self, user_id: UUID, budget_id: UUID) -> None:
         """Delete a budget"""
-        budget = self.get_budget(user_id, budget_id)
-        self.db.delete(budget)
+        # Category budgets and history go with it via ON DELETE CASCADE
+        deleted = self.db.query(Budget).filter(
+            Budget.budget_id == budget_id,
+            Budget.user_id == user_id
+        ).delete(synchronize_session=False)
+        
+        if not deleted:
+            raise NotFoundError("Budget not found")
+        
         self.db.commit()
+        invalidate_dashboard(user_id)
     
     # ============================================
     # CATEGORY BUDGETS
@@ -158,6 +233,21 @@ class BudgetService:
         self.db.add(cat_budget)
         return cat_budget
     
+    def _sync_allocated_amount(self, budget_id: UUID) -> None:
+        """Recompute a budget's allocated amount from its category rows in SQL"""
+        allocated = select(
+            func.coalesce(func.sum(CategoryBudget.allocated_amount), 0)
+        ).where(
+            CategoryBudget.budget_id == budget_id
+        ).scalar_subquery()
+        
+        self.db.execute(
+            update(Budget)
+            .where(Budget.budget_id == budget_id)
+            .values(allocated_amount=allocated)
+            .execution_options(synchronize_session="fetch")
+        )
+    
     def add_category_budget(
         self,
         user_id: UUID,
@@ -177,12 +267,13 @@ class BudgetService:
             raise ValidationError("Category already has an allocation in this budget")
         
         cat_budget = self._create_category_budget(budget_id, data)
+        self.db.flush()
         
         # Update budget allocated amount
-        budget.allocated_amount = (budget.allocated_amount or 0) + data.allocated_amount
+        self._sync_allocated_amount(budget.budget_id)
         
         self.db.commit()
-        self.db.refresh(cat_budget)
+        invalidate_dashboard(user_id)
         
         return cat_budget
     
@@ -203,16 +294,16 @@ class BudgetService:
         
         old_amount = cat_budget.allocated_amount
         
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(cat_budget, field, value)
+        for field in data.model_fields_set:
+            setattr(cat_budget, field, getattr(data, field))
         
         # Update parent budget allocated amount if amount changed
         if data.allocated_amount is not None and data.allocated_amount != old_amount:
-            budget = cat_budget.budget
-            budget.allocated_amount = (budget.allocated_amount or 0) - old_amount + data.allocated_amount
+            self.db.flush()
+            self._sync_allocated_amount(cat_budget.budget_id)
         
         self.db.commit()
-        self.db.refresh(cat_budget)
+        invalidate_dashboard(user_id)
         
         return cat_budget
     
@@ -237,14 +328,23 @@ class BudgetService:
             if not budget:
                 raise NotFoundError("No active budget found")
         
-        # Calculate total spending for the period
-        total_spent = self.db.query(func.sum(Expense.amount)).filter(
+        # Spending for the period per category, in one query
+        rows = self.db.query(Expense.category_id, func.sum(Expense.amount)).filter(
             Expense.user_id == user_id,
             Expense.expense_date >= budget.start_date,
             Expense.expense_date <= budget.end_date
-        ).scalar() or Decimal('0')
+        ).group_by(Expense.category_id).all()
+        
+        spent_by_category = {category_id: amount for category_id, amount in rows}
         
-        budget.spent_amount = total_spent
+        # No spending in the window and nothing recorded yet: nothing to write
+        if not spent_by_category and not budget.spent_amount and not any(
+            cat_budget.spent_amount for cat_budget in budget.category_budgets
+        ):
+            return budget
+        
+        # Total includes uncategorized expenses (category_id NULL)
+        budget.spent_amount = sum(spent_by_category.values(), Decimal('0'))
         
         # Update status if over budget
         if budget.spent_amount > budget.total_amount:
@@ -252,17 +352,10 @@ class BudgetService:
         
         # Update category budgets
         for cat_budget in budget.category_budgets:
-            cat_spent = self.db.query(func.sum(Expense.amount)).filter(
-                Expense.user_id == user_id,
-                Expense.category_id == cat_budget.category_id,
-                Expense.expense_date >= budget.start_date,
-                Expense.expense_date <= budget.end_date
-            ).scalar() or Decimal('0')
-            
-            cat_budget.spent_amount = cat_spent
+            cat_budget.spent_amount = spent_by_category.get(cat_budget.category_id, Decimal('0'))
         
         self.db.commit()
-        self.db.refresh(budget)
+        invalidate_dashboard(user_id)
         
         return budget
     
@@ -280,34 +373,87 @@ class BudgetService:
         if not budget:
             return None
         
-        # Update total spent
-        budget.spent_amount = (budget.spent_amount or 0) + expense.amount
-        
-        # Update category budget if exists
+        # Update category budget if exists. Spent amount is updated
+        # atomically in the database (no read-modify-write).
+        cat_alert = None
         if expense.category_id:
-            cat_budget = self.db.query(CategoryBudget).filter(
-                CategoryBudget.budget_id == budget.budget_id,
-                CategoryBudget.category_id == expense.category_id
-            ).first()
+            self.db.execute(
+                update(CategoryBudget).where(
+                    CategoryBudget.budget_id == budget.budget_id,
+                    CategoryBudget.category_id == expense.category_id
+                ).values(
+                    spent_amount=func.coalesce(CategoryBudget.spent_amount, 0) + expense.amount
+                )
+            )
             
-            if cat_budget:
-                cat_budget.spent_amount = (cat_budget.spent_amount or 0) + expense.amount
-                
-                # Check category alert
-                if not cat_budget.alert_sent and cat_budget.spent_percentage >= cat_budget.alert_at_percentage:
-                    cat_budget.alert_sent = True
-                    # TODO: Trigger notification
+            # Flag the category alert once, like the budget alert below
+            cat_alert_pct = func.coalesce(CategoryBudget.alert_at_percentage, _DEFAULT_ALERT_PERCENTAGE)
+            cat_alert = self.db.execute(
+                update(CategoryBudget).where(
+                    CategoryBudget.budget_id == budget.budget_id,
+                    CategoryBudget.category_id == expense.category_id,
+                    func.coalesce(CategoryBudget.alert_sent, False) == False,
+                    CategoryBudget.allocated_amount > 0,
+                    CategoryBudget.spent_amount * 100 >= CategoryBudget.allocated_amount * cat_alert_pct
+                ).values(
+                    alert_sent=True
+                ).returning(
+                    CategoryBudget.spent_amount,
+                    CategoryBudget.allocated_amount
+                )
+            ).first()
         
-        # Check budget alert
-        if not budget.alert_sent and budget.spent_percentage >= budget.alert_at_percentage:
-            budget.alert_sent = True
-            # TODO: Trigger notification
+        # Update total spent and status
+        spent = func.coalesce(Budget.spent_amount, 0) + expense.amount
+        self.db.execute(
+            update(Budget).where(
+                Budget.budget_id == budget.budget_id
+            ).values(
+                spent_amount=spent,
+                status=case((spent > Budget.total_amount, 'exceeded'), else_=Budget.status)
+            )
+        )
         
-        # Update status
-        if budget.spent_amount > budget.total_amount:
-            budget.status = 'exceeded'
+        # Flag the alert once. Only the statement that flips alert_sent gets
+        # a row back, so a budget already flagged is not alerted again.
+        alert_pct = func.coalesce(Budget.alert_at_percentage, _DEFAULT_ALERT_PERCENTAGE)
+        budget_alert = self.db.execute(
+            update(Budget).where(
+                Budget.budget_id == budget.budget_id,
+                func.coalesce(Budget.alert_sent, False) == False,
+                Budget.total_amount > 0,
+                Budget.spent_amount * 100 >= Budget.total_amount * alert_pct
+            ).values(
+                alert_sent=True
+            ).returning(
+                Budget.spent_amount,
+                Budget.total_amount
+            )
+        ).first()
         
         self.db.commit()
+        invalidate_dashboard(user_id)
+        
+        notification_service = NotificationService(self.db)
+        
+        if cat_alert:
+            category_name = self.db.query(ExpenseCategory.category_name).filter(
+                ExpenseCategory.category_id == expense.category_id
+            ).scalar()
+            notification_service.notify_budget_alert(
+                user_id=user_id,
+                budget_name=f"{category_name or 'category'} ({budget.budget_name})",
+                spent_percentage=float(cat_alert.spent_amount / cat_alert.allocated_amount * 100),
+                budget_id=budget.budget_id
+            )
+        
+        if budget_alert:
+            notification_service.notify_budget_alert(
+                user_id=user_id,
+                budget_name=budget.budget_name,
+                spent_percentage=float(budget_alert.spent_amount / budget_alert.total_amount * 100),
+                budget_id=budget.budget_id
+            )
         
         return budget
     
@@ -317,7 +463,7 @@ class BudgetService:
     
     def get_budget_stats(self, user_id: UUID) -> Dict[str, Any]:
         """Get budget statistics"""
-        budget = self.get_active_budget(user_id)
+        budget = self.get_active_budget(user_id, include_categories=False)
         
         if not budget:
             return {
@@ -325,22 +471,32 @@ class BudgetService:
                 'message': 'No active budget. Create one to start tracking!'
             }
         
-        # Category breakdown
-        category_spending = []
-        for cat_budget in budget.category_budgets:
-            category = self.db.query(ExpenseCategory).filter(
-                ExpenseCategory.category_id == cat_budget.category_id
-            ).first()
-            
-            category_spending.append({
-                'category_id': str(cat_budget.category_id),
-                'category_name': category.category_name if category else 'Unknown',
-                'allocated': float(cat_budget.allocated_amount),
-                'spent': float(cat_budget.spent_amount),
-                'remaining': cat_budget.remaining_amount,
-                'percentage': cat_budget.spent_percentage,
-                'is_over': cat_budget.is_over_budget,
-            })
+        # Category breakdown from plain column rows, names joined in
+        rows = self.db.query(
+            CategoryBudget.category_id,
+            ExpenseCategory.category_name,
+            CategoryBudget.allocated_amount,
+            CategoryBudget.spent_amount
+        ).outerjoin(
+            ExpenseCategory, CategoryBudget.category_id == ExpenseCategory.category_id
+        ).filter(
+            CategoryBudget.budget_id == budget.budget_id
+        ).all()
+        
+        category_spending = [
+            {
+                'category_id': str(category_id),
+                'category_name': category_name or 'Unknown',
+                'allocated': allocated,
+                'spent': spent,
+                'remaining': allocated - spent,
+                'percentage': round(spent / allocated * 100, 1) if allocated > 0 else 0,
+                'is_over': spent > allocated,
+            }
+            for category_id, category_name, allocated, spent in (
+                (row[0], row[1], float(row[2] or 0), float(row[3] or 0)) for row in rows
+            )
+        ]
         
         # Calculate daily average and projection
         days_elapsed = (date.today() - budget.start_date).days + 1
@@ -352,17 +508,17 @@ class BudgetService:
         # Spending trend (compare first half to second half of elapsed period)
         half_point = budget.start_date + timedelta(days=days_elapsed // 2)
         
-        first_half = self.db.query(func.sum(Expense.amount)).filter(
+        # Both halves in one pass over the elapsed period
+        first_half, second_half = self.db.query(
+            func.sum(Expense.amount).filter(Expense.expense_date < half_point),
+            func.sum(Expense.amount).filter(Expense.expense_date >= half_point)
+        ).filter(
             Expense.user_id == user_id,
             Expense.expense_date >= budget.start_date,
-            Expense.expense_date < half_point
-        ).scalar() or 0
-        
-        second_half = self.db.query(func.sum(Expense.amount)).filter(
-            Expense.user_id == user_id,
-            Expense.expense_date >= half_point,
             Expense.expense_date <= date.today()
-        ).scalar() or 0
+        ).one()
+        first_half = float(first_half or 0)
+        second_half = float(second_half or 0)
         
         if first_half > 0:
             if second_half > first_half * 1.1:
@@ -412,7 +568,7 @@ class BudgetService:
             description=data.description,
             budget_type=data.budget_type,
             total_amount=data.total_amount,
-            category_allocations=json.dumps([a.model_dump() for a in data.category_allocations]) if data.category_allocations else None,
+            category_allocations=[a.model_dump(mode='json') for a in data.category_allocations] if data.category_allocations else None,
             savings_target_percentage=data.savings_target_percentage,
             is_default=data.is_default,
         )
@@ -438,8 +594,7 @@ class BudgetService:
         if not end_date:
             if template.budget_type == 'monthly':
                 # End of month
-                next_month = data.start_date.replace(day=28) + timedelta(days=4)
-                end_date = next_month - timedelta(days=next_month.day)
+                end_date = _month_end(data.start_date.year, data.start_date.month)
             elif template.budget_type == 'weekly':
                 end_date = data.start_date + timedelta(days=6)
             else:
@@ -451,8 +606,7 @@ class BudgetService:
         # Parse category allocations
         category_budgets = []
         if template.category_allocations:
-            allocations = json.loads(template.category_allocations)
-            for alloc in allocations:
+            for alloc in template.category_allocations:
                 if alloc.get('percentage'):
                     amount = total_amount * Decimal(str(alloc['percentage'])) / 100
                 else:
@@ -489,8 +643,7 @@ class BudgetService:
         
         if data.budget_type == 'monthly':
             start_date = today.replace(day=1)
-            next_month = start_date.replace(day=28) + timedelta(days=4)
-            end_date = next_month - timedelta(days=next_month.day)
+            end_date = _month_end(start_date.year, start_date.month)
             budget_name = f"Budget - {start_date.strftime('%B %Y')}"
         else:
             # Weekly - start from Monday
@@ -552,16 +705,14 @@ class BudgetService:
         if existing:
             return existing
         
-        # Get today's spending
-        daily_spent = self.db.query(func.sum(Expense.amount)).filter(
-            Expense.user_id == user_id,
-            Expense.expense_date == today
-        ).scalar() or 0
-        
-        daily_count = self.db.query(func.count(Expense.expense_id)).filter(
+        # Get today's spending and transaction count in one pass
+        daily_spent, daily_count = self.db.query(
+            func.coalesce(func.sum(Expense.amount), 0),
+            func.count(Expense.expense_id)
+        ).filter(
             Expense.user_id == user_id,
             Expense.expense_date == today
-        ).scalar() or 0
+        ).one()
         
         history = BudgetHistory(
             budget_id=budget.budget_id,
@@ -576,7 +727,6 @@ class BudgetService:
         
         self.db.add(history)
         self.db.commit()
-        self.db.refresh(history)
         
         return history
     
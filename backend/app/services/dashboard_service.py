@@ -5,21 +5,61 @@ Aggregates data from all services for the main dashboard view
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from typing import Dict, Any, List, Optional
+from sqlalchemy import func, and_, tuple_
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
 from datetime import date, datetime, timedelta
 from decimal import Decimal
+from dataclasses import dataclass
+import asyncio
+import random
 
-from app.models.expense import Expense, ExpenseCategory, DailyCheckin, SpendingStreak
+from app.models.expense import Expense, ExpenseCategory, ExpenseEmotion, DailyCheckin, SpendingStreak
 from app.models.income import IncomeSource, IncomeHistory
 from app.models.goal import FinancialGoal
 from app.models.budget import Budget
-from app.models.recurring_expense import RecurringExpense, UpcomingBill
+from app.models.recurring_expense import UpcomingBill
 from app.models.notification import Notification
 
 from app.services.budget_service import BudgetService
 from app.services.notification_service import NotificationService
+from app.database import run_in_session
+from app.core.cache import dashboard_cache
+
+# Greeting by hour of day: morning until noon, afternoon until 5pm
+_GREETINGS = ("Good morning",) * 12 + ("Good afternoon",) * 5 + ("Good evening",) * 7
+
+_TIPS = (
+    "💡 Try the 24-hour rule: Wait a day before non-essential purchases.",
+    "💡 Log emotions with every purchase to understand your spending triggers.",
+    "💡 Review your goals weekly to stay motivated.",
+    "💡 Pack lunch tomorrow to save money and eat healthier.",
+    "💡 Celebrate small wins - every dollar saved counts!",
+)
+
+
+@dataclass(frozen=True)
+class DashboardDates:
+    """Date boundaries for one dashboard request, computed once"""
+    today: date
+    month_start: date
+    week_start: date
+    next_week: date
+    last_month_start: date
+    last_month_same_day: date
+    
+    @classmethod
+    def for_day(cls, today: date) -> 'DashboardDates':
+        month_start = today.replace(day=1)
+        last_month_start = (month_start - timedelta(days=1)).replace(day=1)
+        return cls(
+            today=today,
+            month_start=month_start,
+            week_start=today - timedelta(days=today.weekday()),
+            next_week=today + timedelta(days=7),
+            last_month_start=last_month_start,
+            last_month_same_day=last_month_start + timedelta(days=today.day - 1),
+        )
 
 
 class DashboardService:
@@ -30,64 +70,82 @@ class DashboardService:
         self.budget_service = BudgetService(db)
         self.notification_service = NotificationService(db)
     
-    def get_dashboard(self, user_id: UUID) -> Dict[str, Any]:
+    async def get_dashboard(self, user_id: UUID) -> Dict[str, Any]:
         """
         Get complete dashboard data for a user.
         This is the main endpoint for the mobile app home screen.
+        
+        The sections are independent reads, so they run concurrently on the
+        shared parallel-read workers, each with its own database session
+        (Sessions are not thread-safe). The assembled
+        payload is cached briefly per user; expense, budget and goal writes
+        invalidate it.
         """
-        today = date.today()
+        cached = dashboard_cache.get(user_id)
+        if cached is not None:
+            return cached
+        
+        dates = DashboardDates.for_day(date.today())
+        
+        # (dashboard key, section read through an isolated service)
+        sections = (
+            ('quick_stats', lambda svc: svc._get_quick_stats(user_id, dates)),
+            ('budget_summary', lambda svc: svc._get_budget_summary(user_id)),
+            ('spending_today', lambda svc: svc._get_today_spending(user_id, dates, with_allowance=False)),
+            ('goals_overview', lambda svc: svc._get_goals_overview(user_id)),
+            ('upcoming_bills', lambda svc: svc._get_upcoming_bills(user_id, dates)),
+            ('recent_transactions', lambda svc: svc._get_recent_transactions(user_id)),
+            ('streaks', lambda svc: svc._get_streaks(user_id)),
+            ('notifications', lambda svc: svc._get_notifications(user_id)),
+            ('insights', lambda svc: svc._get_quick_insights(user_id, dates)),
+            ('checkin_status', lambda svc: svc._get_checkin_status(user_id, dates)),
+        )
+        bind = self.db.get_bind()
+        results = await asyncio.gather(*(
+            run_in_session(bind, lambda db, section=section: section(DashboardService(db)))
+            for _, section in sections
+        ))
         
         dashboard = {
-            'generated_at': datetime.utcnow().isoformat(),
+            'generated_at': datetime.utcnow(),
             'greeting': self._get_greeting(),
-            'quick_stats': self._get_quick_stats(user_id, today),
-            'budget_summary': self._get_budget_summary(user_id),
-            'spending_today': self._get_today_spending(user_id, today),
-            'goals_overview': self._get_goals_overview(user_id),
-            'upcoming_bills': self._get_upcoming_bills(user_id, today),
-            'recent_transactions': self._get_recent_transactions(user_id),
-            'streaks': self._get_streaks(user_id),
-            'notifications': self._get_notifications(user_id),
-            'insights': self._get_quick_insights(user_id),
-            'checkin_status': self._get_checkin_status(user_id, today),
         }
+        for (key, _), result in zip(sections, results):
+            dashboard[key] = result
+        
+        # Today's allowance comes from the budget summary's active budget
+        # rather than a second lookup of the same budget
+        dashboard['spending_today'].update(self._allowance_fields(
+            dashboard['spending_today']['total'],
+            dashboard['budget_summary'].get('daily_allowance')
+        ))
+        
+        dashboard_cache.set(user_id, dashboard)
         
         return dashboard
     
     def _get_greeting(self) -> str:
         """Get time-appropriate greeting"""
-        hour = datetime.now().hour
-        if hour < 12:
-            return "Good morning"
-        elif hour < 17:
-            return "Good afternoon"
-        else:
-            return "Good evening"
+        return _GREETINGS[datetime.now().hour]
     
-    def _get_quick_stats(self, user_id: UUID, today: date) -> Dict[str, Any]:
+    def _get_quick_stats(self, user_id: UUID, dates: DashboardDates) -> Dict[str, Any]:
         """Get quick financial stats"""
-        # This month's dates
-        month_start = today.replace(day=1)
-        next_month = (month_start + timedelta(days=32)).replace(day=1)
-        month_end = next_month - timedelta(days=1)
-        
-        # This week's dates
-        week_start = today - timedelta(days=today.weekday())
-        week_end = week_start + timedelta(days=6)
-        
-        # Monthly spending
-        monthly_spending = self.db.query(func.sum(Expense.amount)).filter(
-            Expense.user_id == user_id,
-            Expense.expense_date >= month_start,
-            Expense.expense_date <= today
-        ).scalar() or Decimal('0')
-        
-        # Weekly spending
-        weekly_spending = self.db.query(func.sum(Expense.amount)).filter(
+        today = dates.today
+        month_start = dates.month_start
+        
+        # Monthly, weekly and last-month spending in one pass over expenses
+        monthly_spending, weekly_spending, last_month_spending = self.db.query(
+            func.sum(Expense.amount).filter(Expense.expense_date >= month_start),
+            func.sum(Expense.amount).filter(Expense.expense_date >= dates.week_start),
+            func.sum(Expense.amount).filter(Expense.expense_date <= dates.last_month_same_day)
+        ).filter(
             Expense.user_id == user_id,
-            Expense.expense_date >= week_start,
+            Expense.expense_date >= dates.last_month_start,
             Expense.expense_date <= today
-        ).scalar() or Decimal('0')
+        ).one()
+        monthly_spending = monthly_spending or Decimal('0')
+        weekly_spending = weekly_spending or Decimal('0')
+        last_month_spending = last_month_spending or Decimal('0')
         
         # Monthly income
         monthly_income = self.db.query(func.sum(IncomeHistory.net_amount)).join(IncomeSource).filter(
@@ -99,16 +157,6 @@ class DashboardService:
         # Net this month
         net_this_month = float(monthly_income) - float(monthly_spending)
         
-        # Compared to last month
-        last_month_start = (month_start - timedelta(days=1)).replace(day=1)
-        last_month_same_day = last_month_start + timedelta(days=today.day - 1)
-        
-        last_month_spending = self.db.query(func.sum(Expense.amount)).filter(
-            Expense.user_id == user_id,
-            Expense.expense_date >= last_month_start,
-            Expense.expense_date <= last_month_same_day
-        ).scalar() or Decimal('0')
-        
         if last_month_spending > 0:
             spending_change = ((float(monthly_spending) - float(last_month_spending)) / float(last_month_spending)) * 100
         else:
@@ -130,106 +178,188 @@ class DashboardService:
         except Exception:
             return {'has_active_budget': False}
     
-    def _get_today_spending(self, user_id: UUID, today: date) -> Dict[str, Any]:
-        """Get today's spending details"""
-        today_expenses = self.db.query(Expense).filter(
-            Expense.user_id == user_id,
-            Expense.expense_date == today
-        ).order_by(Expense.created_at.desc()).all()
-        
-        total = sum(float(e.amount) for e in today_expenses)
+    def _get_today_spending(
+        self,
+        user_id: UUID,
+        dates: DashboardDates,
+        with_allowance: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Get today's spending details.
         
-        # Get budget daily allowance
-        budget = self.budget_service.get_active_budget(user_id)
-        daily_allowance = budget.daily_allowance if budget else None
+        with_allowance=False skips the active budget lookup; the caller adds
+        the allowance fields with _allowance_fields.
+        """
+        total, transaction_count = self.db.query(
+            func.sum(Expense.amount),
+            func.count(Expense.expense_id)
+        ).filter(
+            Expense.user_id == user_id,
+            Expense.expense_date == dates.today
+        ).one()
+        total = float(total or 0)
+        
+        # Only the latest five are displayed
+        recent_expenses = self.db.query(
+            Expense.expense_id,
+            Expense.amount,
+            Expense.merchant_name,
+            ExpenseCategory.category_name,
+            ExpenseEmotion.emotion_id
+        ).outerjoin(
+            Expense.category
+        ).outerjoin(
+            Expense.emotion
+        ).filter(
+            Expense.user_id == user_id,
+            Expense.expense_date == dates.today
+        ).order_by(Expense.created_at.desc()).limit(5).all()
         
-        return {
+        spending = {
             'total': total,
-            'transaction_count': len(today_expenses),
-            'daily_allowance': daily_allowance,
-            'remaining_allowance': daily_allowance - total if daily_allowance else None,
-            'is_over_allowance': total > daily_allowance if daily_allowance else False,
+            'transaction_count': transaction_count,
             'transactions': [
                 {
-                    'expense_id': str(e.expense_id),
+                    'expense_id': e.expense_id,
                     'amount': float(e.amount),
                     'merchant': e.merchant_name,
-                    'category': e.category.category_name if e.category else None,
-                    'has_emotion': e.emotion is not None,
+                    'category': e.category_name,
+                    'has_emotion': e.emotion_id is not None,
                 }
-                for e in today_expenses[:5]  # Last 5
+                for e in recent_expenses
             ]
         }
+        
+        if with_allowance:
+            # Get budget daily allowance
+            budget = self.budget_service.get_active_budget(user_id, include_categories=False)
+            spending.update(self._allowance_fields(
+                total, budget.daily_allowance if budget else None
+            ))
+        
+        return spending
+    
+    def _allowance_fields(self, total: float, daily_allowance: Optional[float]) -> Dict[str, Any]:
+        """Today's spending measured against the budget's daily allowance"""
+        return {
+            'daily_allowance': daily_allowance,
+            'remaining_allowance': daily_allowance - total if daily_allowance else None,
+            'is_over_allowance': total > daily_allowance if daily_allowance else False,
+        }
     
     def _get_goals_overview(self, user_id: UUID) -> Dict[str, Any]:
         """Get goals overview"""
-        goals = self.db.query(FinancialGoal).filter(
+        active_filter = (
             FinancialGoal.user_id == user_id,
             FinancialGoal.status == 'active'
-        ).order_by(FinancialGoal.priority_level.desc()).all()
+        )
+        
+        active_goals, total_target, total_saved = self.db.query(
+            func.count(FinancialGoal.goal_id),
+            func.sum(FinancialGoal.target_amount),
+            func.sum(func.coalesce(FinancialGoal.current_amount, 0))
+        ).filter(*active_filter).one()
+        total_target = float(total_target or 0)
+        total_saved = float(total_saved or 0)
         
-        total_target = sum(float(g.target_amount) for g in goals)
-        total_saved = sum(float(g.current_amount or 0) for g in goals)
+        # Top 3 by priority
+        goals = self.db.query(FinancialGoal).filter(*active_filter).order_by(
+            FinancialGoal.priority_level.desc()
+        ).limit(3).all()
         
         goals_data = []
-        for goal in goals[:3]:  # Top 3 by priority
+        for goal in goals:
             goals_data.append({
-                'goal_id': str(goal.goal_id),
+                'goal_id': goal.goal_id,
                 'name': goal.goal_name,
                 'target': float(goal.target_amount),
                 'current': float(goal.current_amount or 0),
                 'percentage': goal.completion_percentage,
-                'deadline': goal.deadline_date.isoformat() if goal.deadline_date else None,
+                'deadline': goal.deadline_date,
                 'days_remaining': goal.days_remaining,
                 'is_on_track': goal.is_on_track,
             })
         
         return {
-            'active_goals': len(goals),
+            'active_goals': active_goals,
             'total_target': total_target,
             'total_saved': total_saved,
             'overall_progress': round(total_saved / total_target * 100, 1) if total_target > 0 else 0,
             'top_goals': goals_data,
         }
     
-    def _get_upcoming_bills(self, user_id: UUID, today: date) -> List[Dict[str, Any]]:
+    def _get_upcoming_bills(self, user_id: UUID, dates: DashboardDates) -> List[Dict[str, Any]]:
         """Get upcoming bills for next 7 days"""
-        next_week = today + timedelta(days=7)
+        today = dates.today
         
-        bills = self.db.query(UpcomingBill).join(RecurringExpense).filter(
-            RecurringExpense.user_id == user_id,
+        # upcoming_bills carries the recurring expense's display fields, so
+        # no join or per-row relationship load is needed
+        bills = self.db.query(UpcomingBill).filter(
+            UpcomingBill.user_id == user_id,
             UpcomingBill.due_date >= today,
-            UpcomingBill.due_date <= next_week,
-            UpcomingBill.status == 'pending'
+            UpcomingBill.due_date <= dates.next_week
         ).order_by(UpcomingBill.due_date).limit(5).all()
         
         return [
             {
-                'bill_id': str(bill.bill_id),
-                'name': bill.recurring_expense.expense_name,
-                'amount': float(bill.amount),
-                'due_date': bill.due_date.isoformat(),
+                'bill_id': bill.bill_id,
+                'name': bill.expense_name,
+                'amount': float(bill.expected_amount),
+                'due_date': bill.due_date,
                 'days_until_due': (bill.due_date - today).days,
-                'category': bill.recurring_expense.category,
+                'category': bill.expense_type,
             }
             for bill in bills
         ]
     
-    def _get_recent_transactions(self, user_id: UUID) -> List[Dict[str, Any]]:
-        """Get recent transactions"""
-        expenses = self.db.query(Expense).filter(
+    def _get_recent_transactions(
+        self,
+        user_id: UUID,
+        limit: int = 10,
+        before: Optional[Tuple[date, datetime]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get recent transactions, newest first.
+        
+        Pages with a keyset: pass the last row's (date, created_at) as
+        `before` to get the rows after it.
+        """
+        query = self.db.query(
+            Expense.expense_id,
+            Expense.expense_date,
+            Expense.created_at,
+            Expense.amount,
+            Expense.merchant_name,
+            ExpenseCategory.category_name,
+            ExpenseEmotion.emotion_id,
+            ExpenseEmotion.primary_emotion
+        ).outerjoin(
+            Expense.category
+        ).outerjoin(
+            Expense.emotion
+        ).filter(
             Expense.user_id == user_id
-        ).order_by(Expense.expense_date.desc(), Expense.created_at.desc()).limit(10).all()
+        )
+        
+        if before is not None:
+            query = query.filter(
+                tuple_(Expense.expense_date, Expense.created_at) < tuple_(*before)
+            )
+        
+        expenses = query.order_by(
+            Expense.expense_date.desc(), Expense.created_at.desc()
+        ).limit(limit).all()
         
         return [
             {
-                'expense_id': str(e.expense_id),
-                'date': e.expense_date.isoformat(),
+                'expense_id': e.expense_id,
+                'date': e.expense_date,
+                'created_at': e.created_at,
                 'amount': float(e.amount),
                 'merchant': e.merchant_name,
-                'category': e.category.category_name if e.category else None,
-                'has_emotion': e.emotion is not None,
-                'emotion': e.emotion.primary_emotion if e.emotion else None,
+                'category': e.category_name,
+                'has_emotion': e.emotion_id is not None,
+                'emotion': e.primary_emotion,
             }
             for e in expenses
         ]
@@ -260,57 +390,54 @@ class DashboardService:
     
     def _get_notifications(self, user_id: UUID) -> Dict[str, Any]:
         """Get unread notifications count and recent"""
-        notifications, total, unread = self.notification_service.get_notifications(
-            user_id, limit=5
+        notifications, _, unread = self.notification_service.get_notifications(
+            user_id, limit=5, with_total=False
         )
         
         return {
             'unread_count': unread,
             'recent': [
                 {
-                    'notification_id': str(n.notification_id),
+                    'notification_id': n.notification_id,
                     'title': n.title,
                     'message': n.message[:100] + '...' if len(n.message) > 100 else n.message,
                     'type': n.notification_type,
                     'is_read': n.is_read,
-                    'created_at': n.created_at.isoformat(),
+                    'created_at': n.created_at,
                 }
                 for n in notifications
             ]
         }
     
-    def _get_quick_insights(self, user_id: UUID) -> Dict[str, Any]:
+    def _get_quick_insights(self, user_id: UUID, dates: DashboardDates) -> Dict[str, Any]:
         """Get quick AI insights for dashboard"""
         # This is a simplified version - the full insights are in insights API
         
-        # Get emotional spending percentage
-        today = date.today()
-        month_start = today.replace(day=1)
-        
-        total_spending = self.db.query(func.sum(Expense.amount)).filter(
-            Expense.user_id == user_id,
-            Expense.expense_date >= month_start
-        ).scalar() or Decimal('0')
-        
-        emotional_spending = self.db.query(func.sum(Expense.amount)).join(
+        # Per-category totals with their emotion-tagged share, one pass.
+        # Uncategorized expenses form a NULL-named group that only counts
+        # toward the totals.
+        rows = self.db.query(
+            ExpenseCategory.category_name,
+            func.sum(Expense.amount).label('total'),
+            func.sum(Expense.amount).filter(ExpenseEmotion.emotion_id.isnot(None))
+        ).select_from(Expense).outerjoin(
+            Expense.category
+        ).outerjoin(
             Expense.emotion
         ).filter(
             Expense.user_id == user_id,
-            Expense.expense_date >= month_start
-        ).scalar() or Decimal('0')
+            Expense.expense_date >= dates.month_start
+        ).group_by(ExpenseCategory.category_name).order_by(
+            func.sum(Expense.amount).desc()
+        ).all()
+        
+        total_spending = sum((row[1] for row in rows), Decimal('0'))
+        emotional_spending = sum((row[2] or 0 for row in rows), Decimal('0'))
         
         emotional_pct = round(float(emotional_spending) / float(total_spending) * 100, 1) if total_spending > 0 else 0
         
         # Get top spending category
-        top_category = self.db.query(
-            ExpenseCategory.category_name,
-            func.sum(Expense.amount).label('total')
-        ).join(Expense).filter(
-            Expense.user_id == user_id,
-            Expense.expense_date >= month_start
-        ).group_by(ExpenseCategory.category_name).order_by(
-            func.sum(Expense.amount).desc()
-        ).first()
+        top_category = next((row for row in rows if row[0] is not None), None)
         
         return {
             'emotional_spending_pct': emotional_pct,
@@ -323,25 +450,16 @@ class DashboardService:
     
     def _get_daily_tip(self, emotional_pct: float) -> str:
         """Get a contextual daily tip"""
-        tips = [
-            "💡 Try the 24-hour rule: Wait a day before non-essential purchases.",
-            "💡 Log emotions with every purchase to understand your spending triggers.",
-            "💡 Review your goals weekly to stay motivated.",
-            "💡 Pack lunch tomorrow to save money and eat healthier.",
-            "💡 Celebrate small wins - every dollar saved counts!",
-        ]
-        
         if emotional_pct > 50:
             return "💡 High emotional spending this month. Consider a brief pause before your next purchase."
         
-        import random
-        return random.choice(tips)
+        return random.choice(_TIPS)
     
-    def _get_checkin_status(self, user_id: UUID, today: date) -> Dict[str, Any]:
+    def _get_checkin_status(self, user_id: UUID, dates: DashboardDates) -> Dict[str, Any]:
         """Get today's check-in status"""
         checkin = self.db.query(DailyCheckin).filter(
             DailyCheckin.user_id == user_id,
-            DailyCheckin.checkin_date == today
+            DailyCheckin.checkin_date == dates.today
         ).first()
         
         if not checkin:
@@ -369,12 +487,20 @@ class DashboardService:
         today = date.today()
         week_start = today - timedelta(days=7)
         
-        # Total spending
-        total_spent = self.db.query(func.sum(Expense.amount)).filter(
+        prev_week_start = week_start - timedelta(days=7)
+        
+        # This week's total and count plus the previous week's total, one pass
+        total_spent, transactions_count, prev_week_spent = self.db.query(
+            func.sum(Expense.amount).filter(Expense.expense_date >= week_start),
+            func.count(Expense.expense_id).filter(Expense.expense_date >= week_start),
+            func.sum(Expense.amount).filter(Expense.expense_date < week_start)
+        ).filter(
             Expense.user_id == user_id,
-            Expense.expense_date >= week_start,
+            Expense.expense_date >= prev_week_start,
             Expense.expense_date <= today
-        ).scalar() or Decimal('0')
+        ).one()
+        total_spent = total_spent or Decimal('0')
+        prev_week_spent = prev_week_spent or Decimal('0')
         
         # Category breakdown
         categories = self.db.query(
@@ -389,29 +515,10 @@ class DashboardService:
         ).limit(5).all()
         
         # Compare to previous week
-        prev_week_start = week_start - timedelta(days=7)
-        prev_week_spent = self.db.query(func.sum(Expense.amount)).filter(
-            Expense.user_id == user_id,
-            Expense.expense_date >= prev_week_start,
-            Expense.expense_date < week_start
-        ).scalar() or Decimal('0')
-        
         change = 0
         if prev_week_spent > 0:
             change = ((float(total_spent) - float(prev_week_spent)) / float(prev_week_spent)) * 100
         
-        # Goals progress
-        goals = self.db.query(FinancialGoal).filter(
-            FinancialGoal.user_id == user_id,
-            FinancialGoal.status == 'active'
-        ).all()
-        
-        goals_contributed = 0
-        for goal in goals:
-            # Check if any contributions this week
-            # This would need GoalProgressHistory
-            pass
-        
         return {
             'period': f"{week_start.isoformat()} to {today.isoformat()}",
             'total_spent': float(total_spent),
@@ -420,10 +527,6 @@ class DashboardService:
                 {'category': c[0], 'amount': float(c[1])}
                 for c in categories
             ],
-            'transactions_count': self.db.query(func.count(Expense.expense_id)).filter(
-                Expense.user_id == user_id,
-                Expense.expense_date >= week_start,
-                Expense.expense_date <= today
-            ).scalar() or 0,
+            'transactions_count': transactions_count,
             'daily_average': round(float(total_spent) / 7, 2),
         }
\ No newline at end of file
@@ -4,8 +4,8 @@ Dependent Service
 Business logic for managing financial dependents (humans, pets, shared costs)
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, extract
+from sqlalchemy.orm import Session, selectinload, raiseload
+from sqlalchemy import and_, func, update
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import date, datetime
@@ -23,6 +23,21 @@ from app.schemas.dependent import (
     BrotherEducationSetup, PetSetup
 )
 from app.core.exceptions import NotFoundError, ValidationError
+from app.config import settings
+
+_CENT = Decimal('0.01')
+
+
+def _with_related() -> tuple:
+    """Loader options for dependents whose types, expenses and shared costs will be read"""
+    options = (
+        selectinload(Dependent.expense_types),
+        selectinload(Dependent.expenses),
+        selectinload(Dependent.shared_costs),
+    )
+    if settings.RAISE_ON_LAZY_LOAD:
+        options += (raiseload('*'),)
+    return options
 
 
 class DependentService:
@@ -45,7 +60,7 @@ class DependentService:
         dependent = Dependent(
             user_id=user_id,
             dependent_name=data.dependent_name,
-            relationship=data.relationship.value,
+            relationship_type=data.relationship.value,
             dependent_type=data.dependent_type.value,
             dependent_category=data.dependent_category.value,
             date_of_birth=data.date_of_birth,
@@ -67,14 +82,14 @@ class DependentService:
             profile_image_url=data.profile_image_url
         )
         
-        self.db.add(dependent)
-        self.db.flush()  # Get the ID without committing
-        
-        # Create expense types if provided
+        # Expense types ride along on the relationship: the commit's flush
+        # inserts the dependent, then all types in one batched INSERT
         if data.expense_types:
-            for exp_type in data.expense_types:
-                self._create_expense_type(dependent.dependent_id, exp_type)
+            dependent.expense_types = [
+                self._build_expense_type(exp_type) for exp_type in data.expense_types
+            ]
         
+        self.db.add(dependent)
         self.db.commit()
         self.db.refresh(dependent)
         
@@ -83,11 +98,16 @@ class DependentService:
     def get_dependent(
         self,
         dependent_id: UUID,
-        user_id: UUID
+        user_id: UUID,
+        include_related: bool = False
     ) -> Dependent:
         """Get a single dependent by ID"""
         
-        dependent = self.db.query(Dependent).filter(
+        query = self.db.query(Dependent)
+        if include_related:
+            query = query.options(*_with_related())
+        
+        dependent = query.filter(
             Dependent.dependent_id == dependent_id,
             Dependent.user_id == user_id
         ).first()
@@ -102,14 +122,23 @@ class DependentService:
         user_id: UUID,
         is_active: Optional[bool] = True,
         dependent_type: Optional[str] = None,
-        dependent_category: Optional[str] = None
+        dependent_category: Optional[str] = None,
+        include_related: bool = False
     ) -> List[Dependent]:
-        """Get all dependents for a user"""
+        """
+        Get all dependents for a user.
+        
+        include_related loads every dependent's expense types, expenses and
+        shared costs up front (one IN query each) for callers that read them.
+        """
         
         query = self.db.query(Dependent).filter(
             Dependent.user_id == user_id
         )
         
+        if include_related:
+            query = query.options(*_with_related())
+        
         if is_active is not None:
             query = query.filter(Dependent.is_active == is_active)
         
@@ -129,21 +158,33 @@ class DependentService:
     ) -> Dependent:
         """Update an existing dependent"""
         
-        dependent = self.get_dependent(dependent_id, user_id)
-        
         update_data = data.model_dump(exclude_unset=True)
+        if not update_data:
+            return self.get_dependent(dependent_id, user_id)
+        
+        # Handle enum conversions. Both columns are NOT NULL, so an explicit
+        # null leaves the stored value unchanged.
+        relationship = update_data.pop('relationship', None)
+        if relationship:
+            update_data['relationship_type'] = relationship.value
+        dependent_category = update_data.pop('dependent_category', None)
+        if dependent_category:
+            update_data['dependent_category'] = dependent_category.value
+        if not update_data:
+            return self.get_dependent(dependent_id, user_id)
+        
+        # Ownership check and write in one statement
+        dependent = self.db.execute(
+            update(Dependent)
+            .where(Dependent.dependent_id == dependent_id, Dependent.user_id == user_id)
+            .values(**update_data)
+            .returning(Dependent)
+        ).scalars().first()
         
-        # Handle enum conversions
-        if 'relationship' in update_data and update_data['relationship']:
-            update_data['relationship'] = update_data['relationship'].value
-        if 'dependent_category' in update_data and update_data['dependent_category']:
-            update_data['dependent_category'] = update_data['dependent_category'].value
-        
-        for field, value in update_data.items():
-            setattr(dependent, field, value)
+        if not dependent:
+            raise NotFoundError(f"Dependent {dependent_id} not found")
         
         self.db.commit()
-        self.db.refresh(dependent)
         
         return dependent
     
@@ -155,12 +196,19 @@ class DependentService:
     ) -> None:
         """Delete or deactivate a dependent"""
         
-        dependent = self.get_dependent(dependent_id, user_id)
+        owned = self.db.query(Dependent).filter(
+            Dependent.dependent_id == dependent_id,
+            Dependent.user_id == user_id
+        )
         
         if hard_delete:
-            self.db.delete(dependent)
+            # Expenses, types, shared costs and summaries go with it via ON DELETE CASCADE
+            affected = owned.delete(synchronize_session=False)
         else:
-            dependent.is_active = False
+            affected = owned.update({'is_active': False}, synchronize_session=False)
+        
+        if not affected:
+            raise NotFoundError(f"Dependent {dependent_id} not found")
         
         self.db.commit()
     
@@ -168,15 +216,10 @@ class DependentService:
     # EXPENSE TYPE MANAGEMENT
     # ============================================
     
-    def _create_expense_type(
-        self,
-        dependent_id: UUID,
-        data: ExpenseTypeCreate
-    ) -> DependentExpenseType:
-        """Create an expense type for a dependent"""
+    def _build_expense_type(self, data: ExpenseTypeCreate) -> DependentExpenseType:
+        """Build an expense type not yet attached to a dependent or session"""
         
-        expense_type = DependentExpenseType(
-            dependent_id=dependent_id,
+        return DependentExpenseType(
             type_name=data.type_name,
             description=data.description,
             expected_amount=data.expected_amount,
@@ -184,6 +227,16 @@ class DependentService:
             is_recurring=data.is_recurring,
             monthly_budget=data.monthly_budget
         )
+    
+    def _create_expense_type(
+        self,
+        dependent_id: UUID,
+        data: ExpenseTypeCreate
+    ) -> DependentExpenseType:
+        """Create an expense type for a dependent"""
+        
+        expense_type = self._build_expense_type(data)
+        expense_type.dependent_id = dependent_id
         
         self.db.add(expense_type)
         return expense_type
@@ -213,13 +266,17 @@ class DependentService:
     ) -> List[DependentExpenseType]:
         """Get all expense types for a dependent"""
         
-        # Verify ownership
-        self.get_dependent(dependent_id, user_id)
-        
-        return self.db.query(DependentExpenseType).filter(
+        # Ownership is part of the query; only an empty result needs a check
+        expense_types = self.db.query(DependentExpenseType).join(Dependent).filter(
             DependentExpenseType.dependent_id == dependent_id,
+            Dependent.user_id == user_id,
             DependentExpenseType.is_active == True
         ).all()
+        
+        if not expense_types:
+            self.get_dependent(dependent_id, user_id)
+        
+        return expense_types
     
     # ============================================
     # EXPENSE TRACKING
@@ -241,8 +298,9 @@ class DependentService:
         
         if data.is_shared and dependent.shared_responsibility:
             if your_share is None:
-                share_pct = float(dependent.your_share_percentage or 100) / 100
-                your_share = Decimal(str(float(data.amount) * share_pct))
+                pct = dependent.your_share_percentage
+                share_pct = (Decimal('100') if pct is None else pct) / 100
+                your_share = (data.amount * share_pct).quantize(_CENT)
                 partner_share = data.amount - your_share
         
         expense = DependentExpense(
@@ -264,17 +322,26 @@ class DependentService:
         
         self.db.add(expense)
         
-        # Update dependent's total spent
-        dependent.total_spent_to_date = (dependent.total_spent_to_date or Decimal('0')) + data.amount
+        # Running totals are incremented in the database (no read-modify-write)
+        self.db.execute(
+            update(Dependent).where(
+                Dependent.dependent_id == dependent_id
+            ).values(
+                total_spent_to_date=func.coalesce(Dependent.total_spent_to_date, 0) + data.amount
+            )
+        )
         
         # Update expense type if linked
         if data.expense_type_id:
-            expense_type = self.db.query(DependentExpenseType).filter(
-                DependentExpenseType.type_id == data.expense_type_id
-            ).first()
-            if expense_type:
-                expense_type.total_spent = (expense_type.total_spent or Decimal('0')) + data.amount
-                expense_type.last_expense_date = data.expense_date
+            self.db.execute(
+                update(DependentExpenseType).where(
+                    DependentExpenseType.type_id == data.expense_type_id,
+                    DependentExpenseType.dependent_id == dependent_id
+                ).values(
+                    total_spent=func.coalesce(DependentExpenseType.total_spent, 0) + data.amount,
+                    last_expense_date=data.expense_date
+                )
+            )
         
         self.db.commit()
         self.db.refresh(expense)
@@ -292,11 +359,10 @@ class DependentService:
     ) -> List[DependentExpense]:
         """Get expenses for a dependent"""
         
-        # Verify ownership
-        self.get_dependent(dependent_id, user_id)
-        
-        query = self.db.query(DependentExpense).filter(
-            DependentExpense.dependent_id == dependent_id
+        # Ownership is part of the query; only an empty result needs a check
+        query = self.db.query(DependentExpense).join(Dependent).filter(
+            DependentExpense.dependent_id == dependent_id,
+            Dependent.user_id == user_id
         )
         
         if expense_type_id:
@@ -308,9 +374,14 @@ class DependentService:
         if end_date:
             query = query.filter(DependentExpense.expense_date <= end_date)
         
-        return query.order_by(
+        expenses = query.order_by(
             DependentExpense.expense_date.desc()
         ).limit(limit).all()
+        
+        if not expenses:
+            self.get_dependent(dependent_id, user_id)
+        
+        return expenses
     
     # ============================================
     # SHARED COST MANAGEMENT
@@ -360,17 +431,21 @@ class DependentService:
     ) -> List[DependentSharedCost]:
         """Get shared costs for a dependent"""
         
-        # Verify ownership
-        self.get_dependent(dependent_id, user_id)
-        
-        query = self.db.query(DependentSharedCost).filter(
-            DependentSharedCost.dependent_id == dependent_id
+        # Ownership is part of the query; only an empty result needs a check
+        query = self.db.query(DependentSharedCost).join(Dependent).filter(
+            DependentSharedCost.dependent_id == dependent_id,
+            Dependent.user_id == user_id
         )
         
         if status:
             query = query.filter(DependentSharedCost.status == status)
         
-        return query.order_by(DependentSharedCost.due_date.asc()).all()
+        shared_costs = query.order_by(DependentSharedCost.due_date.asc()).all()
+        
+        if not shared_costs:
+            self.get_dependent(dependent_id, user_id)
+        
+        return shared_costs
     
     def record_shared_cost_payment(
         self,
@@ -380,17 +455,15 @@ class DependentService:
     ) -> DependentSharedCost:
         """Record a payment towards a shared cost"""
         
-        # Get shared cost and verify ownership through dependent
-        shared_cost = self.db.query(DependentSharedCost).filter(
-            DependentSharedCost.shared_cost_id == shared_cost_id
+        # Get shared cost, owned through its dependent
+        shared_cost = self.db.query(DependentSharedCost).join(Dependent).filter(
+            DependentSharedCost.shared_cost_id == shared_cost_id,
+            Dependent.user_id == user_id
         ).first()
         
         if not shared_cost:
             raise NotFoundError(f"Shared cost {shared_cost_id} not found")
         
-        # Verify ownership
-        self.get_dependent(shared_cost.dependent_id, user_id)
-        
         # Update appropriate contribution
         if data.payer.lower() == 'you':
             shared_cost.your_contribution_paid = (
@@ -430,7 +503,7 @@ class DependentService:
         # Create the dependent
         dependent_data = DependentCreate(
             dependent_name=data.brother_name,
-            relationship="brother",
+            relationship_type="brother",
             dependent_type="human",
             dependent_category="family_education",
             monthly_cost_estimate=data.monthly_savings_target or (data.your_contribution / Decimal('6')),
@@ -438,9 +511,9 @@ class DependentService:
             remaining_semesters=data.remaining_semesters,
             shared_responsibility=True,
             cost_sharing_partners=["Mom"],
-            your_share_percentage=Decimal(str(
-                float(data.your_contribution) / float(data.total_semester_cost) * 100
-            )),
+            your_share_percentage=(
+                data.your_contribution / data.total_semester_cost * 100
+            ).quantize(_CENT),
             partner_contribution_amount=data.mom_contribution,
             institution_name=data.institution_name,
             semester_cost=data.total_semester_cost,
@@ -548,7 +621,7 @@ class DependentService:
         
         dependent_data = DependentCreate(
             dependent_name=data.pet_name,
-            relationship="pet",
+            relationship_type="pet",
             dependent_type="pet",
             dependent_category="pet_care",
             pet_type=data.pet_type,
@@ -567,51 +640,67 @@ class DependentService:
     def get_stats(self, user_id: UUID) -> DependentStats:
         """Get statistics for all dependents"""
         
-        dependents = self.get_user_dependents(user_id, is_active=True)
-        
-        human_deps = [d for d in dependents if d.dependent_type == 'human']
-        pet_deps = [d for d in dependents if d.dependent_type == 'pet']
-        
-        total_monthly = sum(float(d.monthly_cost_estimate or 0) for d in dependents)
-        your_monthly = sum(d.your_monthly_share or 0 for d in dependents)
+        # Counts and monthly costs per (category, type) in one grouped query.
+        # Your share mirrors Dependent.your_monthly_share, NULL without an estimate.
+        your_share = func.round(
+            Dependent.monthly_cost_estimate
+            * func.coalesce(Dependent.your_share_percentage, 100) / 100,
+            2
+        )
+        groups = self.db.query(
+            Dependent.dependent_category,
+            Dependent.dependent_type,
+            func.count(Dependent.dependent_id),
+            func.sum(Dependent.monthly_cost_estimate),
+            func.sum(your_share),
+            func.count(Dependent.dependent_id).filter(Dependent.support_end_date.isnot(None)),
+            func.count(Dependent.dependent_id).filter(Dependent.shared_responsibility == True)
+        ).filter(
+            Dependent.user_id == user_id,
+            Dependent.is_active == True
+        ).group_by(Dependent.dependent_category, Dependent.dependent_type).all()
         
-        # Get spending this month
+        total_dependents = human_dependents = pet_dependents = 0
+        time_bound = shared_count = 0
+        total_monthly = your_monthly = Decimal('0')
+        by_category: Dict[str, Decimal] = {}
+        for category, dep_type, count, monthly, share, bound, shared in groups:
+            total_dependents += count
+            if dep_type == 'human':
+                human_dependents += count
+            elif dep_type == 'pet':
+                pet_dependents += count
+            total_monthly += monthly or 0
+            your_monthly += share or 0
+            time_bound += bound
+            shared_count += shared
+            by_category[category] = by_category.get(category, Decimal('0')) + (share or 0)
+        
+        # Spending this month and this year in one pass over the year
         today = date.today()
         first_of_month = today.replace(day=1)
-        
-        monthly_expenses = self.db.query(
-            func.sum(DependentExpense.amount)
-        ).join(Dependent).filter(
-            Dependent.user_id == user_id,
-            DependentExpense.expense_date >= first_of_month
-        ).scalar() or Decimal('0')
-        
-        # Get spending this year
         first_of_year = today.replace(month=1, day=1)
         
-        yearly_expenses = self.db.query(
+        monthly_expenses, yearly_expenses = self.db.query(
+            func.sum(DependentExpense.amount).filter(DependentExpense.expense_date >= first_of_month),
             func.sum(DependentExpense.amount)
         ).join(Dependent).filter(
             Dependent.user_id == user_id,
             DependentExpense.expense_date >= first_of_year
-        ).scalar() or Decimal('0')
-        
-        # By category breakdown
-        by_category: Dict[str, Decimal] = {}
-        for d in dependents:
-            cat = d.dependent_category
-            by_category[cat] = by_category.get(cat, Decimal('0')) + Decimal(str(d.your_monthly_share or 0))
+        ).one()
+        monthly_expenses = monthly_expenses or Decimal('0')
+        yearly_expenses = yearly_expenses or Decimal('0')
         
         return DependentStats(
-            total_dependents=len(dependents),
-            human_dependents=len(human_deps),
-            pet_dependents=len(pet_deps),
-            total_monthly_cost=Decimal(str(round(total_monthly, 2))),
-            your_monthly_share=Decimal(str(round(your_monthly, 2))),
+            total_dependents=total_dependents,
+            human_dependents=human_dependents,
+            pet_dependents=pet_dependents,
+            total_monthly_cost=total_monthly,
+            your_monthly_share=your_monthly,
             total_spent_this_month=monthly_expenses,
             total_spent_this_year=yearly_expenses,
-            time_bound_dependents=len([d for d in dependents if d.is_time_bound]),
-            shared_responsibility_count=len([d for d in dependents if d.shared_responsibility]),
+            time_bound_dependents=time_bound,
+            shared_responsibility_count=shared_count,
             by_category={k: round(float(v), 2) for k, v in by_category.items()}
         )
     
@@ -627,35 +716,30 @@ class DependentService:
         
         monthly_cost = dependent.your_monthly_share or 0
         
-        # Generate monthly projections
+        monthly_cost_dec = Decimal(str(monthly_cost))
+        end_date = dependent.support_end_date
+        
+        # Generate monthly projections, stepping months as (year, month index)
         projections = []
         current = date.today()
-        total_remaining = Decimal('0')
-        
-        for i in range(months_ahead):
-            month_date = current.replace(day=1)
-            if current.month + i > 12:
-                years_ahead = (current.month + i - 1) // 12
-                month_num = (current.month + i - 1) % 12 + 1
-                month_date = month_date.replace(year=current.year + years_ahead, month=month_num)
-            else:
-                month_date = month_date.replace(month=current.month + i)
+        
+        for month_index in range(current.month - 1, current.month - 1 + months_ahead):
+            month_date = date(current.year + month_index // 12, month_index % 12 + 1, 1)
             
             # Check if still within support period
-            if dependent.support_end_date and month_date > dependent.support_end_date:
+            if end_date and month_date > end_date:
                 break
             
             projections.append({
                 "month": month_date.strftime("%Y-%m"),
                 "amount": monthly_cost
             })
-            total_remaining += Decimal(str(monthly_cost))
         
         return DependentCostProjection(
             dependent_id=dependent.dependent_id,
             dependent_name=dependent.dependent_name,
-            current_monthly_cost=Decimal(str(monthly_cost)),
-            projected_total_remaining=total_remaining,
+            current_monthly_cost=monthly_cost_dec,
+            projected_total_remaining=monthly_cost_dec * len(projections),
             projected_end_date=dependent.support_end_date,
             monthly_projections=projections,
             remaining_semesters=dependent.remaining_semesters,
@@ -682,33 +766,39 @@ class DependentService:
         ).first()
         
         if not summary:
-            # Calculate summary
-            expenses = self.db.query(DependentExpense).filter(
+            # Half-open month range, so the expense_date index applies
+            month_start = date(year, month, 1)
+            next_month_start = date(year + month // 12, month % 12 + 1, 1)
+            
+            # Calculate summary: per expense type totals in one grouped query
+            # (untyped expenses group under a NULL type name)
+            rows = self.db.query(
+                DependentExpenseType.type_name,
+                func.sum(DependentExpense.amount),
+                func.count(DependentExpense.expense_id)
+            ).select_from(DependentExpense).outerjoin(
+                DependentExpenseType,
+                DependentExpense.expense_type_id == DependentExpenseType.type_id
+            ).filter(
                 DependentExpense.dependent_id == dependent_id,
-                extract('year', DependentExpense.expense_date) == year,
-                extract('month', DependentExpense.expense_date) == month
-            ).all()
+                DependentExpense.expense_date >= month_start,
+                DependentExpense.expense_date < next_month_start
+            ).group_by(DependentExpenseType.type_name).all()
             
-            total = sum(float(e.amount) for e in expenses)
-            count = len(expenses)
+            total = sum((row[1] for row in rows), Decimal('0'))
+            count = sum(row[2] for row in rows)
             
             # Breakdown by expense type
             breakdown: Dict[str, float] = {}
-            for e in expenses:
-                if e.expense_type_id:
-                    exp_type = self.db.query(DependentExpenseType).filter(
-                        DependentExpenseType.type_id == e.expense_type_id
-                    ).first()
-                    if exp_type:
-                        breakdown[exp_type.type_name] = breakdown.get(exp_type.type_name, 0) + float(e.amount)
-                else:
-                    breakdown['Other'] = breakdown.get('Other', 0) + float(e.amount)
+            for type_name, type_total, _ in rows:
+                name = type_name or 'Other'
+                breakdown[name] = breakdown.get(name, 0) + float(type_total)
             
             summary = DependentMonthlySummary(
                 dependent_id=dependent_id,
                 year=year,
                 month=month,
-                total_expenses=Decimal(str(total)),
+                total_expenses=total,
                 expense_count=count,
                 expense_breakdown=breakdown
             )
@@ -6,11 +6,12 @@ The heart of Fortuna's behavioral insights
 """
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract, and_
+from sqlalchemy import func, extract, and_, text
 from typing import List, Optional, Dict, Tuple
 from uuid import UUID
 from datetime import date, datetime, timezone, timedelta
 from decimal import Decimal
+import sys
 
 from app.models.expense import (
     Expense, ExpenseCategory, ExpenseEmotion,
@@ -26,6 +27,7 @@ from app.schemas.expense import (
     SubmitReflection
 )
 from app.core.exceptions import NotFoundError, ValidationError
+from app.core.cache import invalidate_dashboard
 
 
 class ExpenseService:
@@ -163,6 +165,7 @@ class ExpenseService:
         self._update_daily_checkin(user_id, data.expense_date, data.amount)
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(expense)
         
         return expense
@@ -238,6 +241,7 @@ class ExpenseService:
             setattr(expense, field, value)
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(expense)
         
         return expense
@@ -252,6 +256,7 @@ class ExpenseService:
         expense = self.get_expense(expense_id, user_id)
         self.db.delete(expense)
         self.db.commit()
+        invalidate_dashboard(user_id)
     
     # ============================================
     # EMOTIONAL TRACKING
@@ -305,6 +310,7 @@ class ExpenseService:
         checkin.emotions_captured = True
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(emotion)
         
         return emotion
@@ -435,6 +441,7 @@ class ExpenseService:
             self._update_streak(user_id, 'daily_logging')
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(checkin)
         
         return checkin
@@ -533,6 +540,7 @@ class ExpenseService:
         checkin.completed_at = datetime.now(timezone.utc)
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         
         return expenses, checkin
     
@@ -600,10 +608,10 @@ class ExpenseService:
         essential, discretionary = self._get_essential_vs_discretionary(user_id, month_start, today)
         
         return ExpenseStats(
-            total_spent_today=Decimal(str(round(total_today, 2))),
-            total_spent_this_week=Decimal(str(round(float(week_total), 2))),
-            total_spent_this_month=Decimal(str(round(total_month, 2))),
-            daily_average=Decimal(str(round(daily_avg, 2))),
+            total_spent_today=round(total_today, 2),
+            total_spent_this_week=round(float(week_total), 2),
+            total_spent_this_month=round(total_month, 2),
+            daily_average=round(daily_avg, 2),
             by_category=by_category,
             by_payment_method=by_payment,
             essential_spending=essential,
@@ -617,7 +625,7 @@ class ExpenseService:
         user_id: UUID,
         start_date: date,
         end_date: date
-    ) -> Dict[str, Decimal]:
+    ) -> Dict[str, float]:
         """Get spending breakdown by category"""
         
         results = self.db.query(
@@ -634,14 +642,14 @@ class ExpenseService:
             ExpenseCategory.category_name
         ).all()
         
-        return {name: Decimal(str(round(float(amount), 2))) for name, amount in results}
+        return {name: round(float(amount), 2) for name, amount in results}
     
     def _get_spending_by_payment_method(
         self,
         user_id: UUID,
         start_date: date,
         end_date: date
-    ) -> Dict[str, Decimal]:
+    ) -> Dict[str, float]:
         """Get spending by payment method"""
         
         results = self.db.query(
@@ -656,14 +664,14 @@ class ExpenseService:
             Expense.payment_method
         ).all()
         
-        return {method or "unknown": Decimal(str(round(float(amount), 2))) for method, amount in results}
+        return {method or "unknown": round(float(amount), 2) for method, amount in results}
     
     def _get_essential_vs_discretionary(
         self,
         user_id: UUID,
         start_date: date,
         end_date: date
-    ) -> Tuple[Decimal, Decimal]:
+    ) -> Tuple[float, float]:
         """Get essential vs discretionary spending"""
         
         essential = self.db.query(
@@ -688,7 +696,7 @@ class ExpenseService:
             ExpenseCategory.is_essential == False
         ).scalar() or 0
         
-        return Decimal(str(round(float(essential), 2))), Decimal(str(round(float(discretionary), 2)))
+        return round(float(essential), 2), round(float(discretionary), 2)
     
     def get_emotional_stats(
         self,
@@ -708,83 +716,105 @@ class ExpenseService:
         else:
             month_end = date(year, month + 1, 1) - timedelta(days=1)
         
-        # Get all emotional expenses for the month
-        emotional_expenses = self.db.query(
-            Expense, ExpenseEmotion
-        ).join(
-            ExpenseEmotion
-        ).filter(
+        month_filters = (
             Expense.user_id == user_id,
             Expense.expense_date >= month_start,
             Expense.expense_date <= month_end
-        ).all()
+        )
         
         # Total spending
         total_month = self.db.query(
             func.sum(Expense.amount)
-        ).filter(
-            Expense.user_id == user_id,
-            Expense.expense_date >= month_start,
-            Expense.expense_date <= month_end
-        ).scalar() or 0
+        ).filter(*month_filters).scalar() or 0
+        
+        # Scalar aggregates over emotional expenses in one pass
+        # (emotional spending = non-necessary purchases)
+        totals = self.db.query(
+            func.sum(Expense.amount).filter(
+                func.coalesce(ExpenseEmotion.was_necessary, False) == False
+            ),
+            func.avg(ExpenseEmotion.stress_level),
+            func.avg(ExpenseEmotion.regret_level),
+            func.count(ExpenseEmotion.emotion_id).filter(ExpenseEmotion.brought_joy == True),
+            func.count(ExpenseEmotion.emotion_id).filter(ExpenseEmotion.regret_level >= 7)
+        ).join(
+            ExpenseEmotion
+        ).filter(*month_filters).first()
         
-        # Emotional spending (non-necessary, non-planned)
-        emotional_amount = sum(
-            float(e.amount) for e, em in emotional_expenses
-            if not em.was_necessary
-        )
+        emotional_amount = float(totals[0] or 0)
+        avg_stress = float(totals[1] or 0)
+        avg_regret = float(totals[2] or 0)
+        joy_count = totals[3] or 0
+        regret_count = totals[4] or 0
         
         emotional_pct = (emotional_amount / float(total_month) * 100) if total_month > 0 else 0
         
-        # By emotion
-        by_emotion: Dict[str, float] = {}
-        for expense, emotion in emotional_expenses:
-            em = emotion.primary_emotion
-            by_emotion[em] = by_emotion.get(em, 0) + float(expense.amount)
-        
-        # By time of day
-        by_time: Dict[str, float] = {}
-        for expense, emotion in emotional_expenses:
-            if emotion.time_of_day:
-                by_time[emotion.time_of_day] = by_time.get(emotion.time_of_day, 0) + float(expense.amount)
-        
-        # By day type
-        by_day: Dict[str, float] = {}
-        for expense, emotion in emotional_expenses:
-            if emotion.day_type:
-                by_day[emotion.day_type] = by_day.get(emotion.day_type, 0) + float(expense.amount)
-        
-        # Averages
-        stress_levels = [em.stress_level for _, em in emotional_expenses if em.stress_level]
-        avg_stress = sum(stress_levels) / len(stress_levels) if stress_levels else 0
-        
-        regret_levels = [em.regret_level for _, em in emotional_expenses if em.regret_level]
-        avg_regret = sum(regret_levels) / len(regret_levels) if regret_levels else 0
-        
-        # Top triggers
-        triggers = [em.trigger_event for _, em in emotional_expenses if em.trigger_event]
-        trigger_counts = {}
-        for t in triggers:
-            trigger_counts[t] = trigger_counts.get(t, 0) + 1
-        top_triggers = sorted(trigger_counts.keys(), key=lambda x: trigger_counts[x], reverse=True)[:5]
+        # By emotion / time of day / day type, built as one JSONB object
+        breakdowns = self.db.query(
+            func.jsonb_build_object(
+                'by_emotion', self._emotion_breakdown(ExpenseEmotion.primary_emotion, month_filters),
+                'by_time_of_day', self._emotion_breakdown(ExpenseEmotion.time_of_day, month_filters),
+                'by_day_type', self._emotion_breakdown(ExpenseEmotion.day_type, month_filters)
+            )
+        ).scalar() or {}
+        
+        by_emotion: Dict[str, float] = breakdowns.get('by_emotion') or {}
+        by_time: Dict[str, float] = breakdowns.get('by_time_of_day') or {}
+        by_day: Dict[str, float] = breakdowns.get('by_day_type') or {}
+        
+        # Top triggers (labels come from a small vocabulary, so intern them)
+        trigger_rows = self.db.query(
+            ExpenseEmotion.trigger_event
+        ).join(
+            Expense
+        ).filter(
+            *month_filters,
+            ExpenseEmotion.trigger_event != None,
+            ExpenseEmotion.trigger_event != ''
+        ).group_by(
+            ExpenseEmotion.trigger_event
+        ).order_by(
+            func.count(ExpenseEmotion.emotion_id).desc()
+        ).limit(5).all()
+        top_triggers = tuple(sys.intern(t) for (t,) in trigger_rows)
         
         # Highest spending emotion
         highest_emotion = max(by_emotion.keys(), key=lambda x: by_emotion[x]) if by_emotion else "none"
         
-        # Joy and regret counts
-        joy_count = sum(1 for _, em in emotional_expenses if em.brought_joy)
-        regret_count = sum(1 for _, em in emotional_expenses if em.regret_level and em.regret_level >= 7)
-        
         return EmotionalSpendingStats(
-            total_emotional_spending=Decimal(str(round(emotional_amount, 2))),
+            total_emotional_spending=round(emotional_amount, 2),
             emotional_spending_percentage=round(emotional_pct, 2),
-            by_emotion={k: Decimal(str(round(v, 2))) for k, v in by_emotion.items()},
-            by_time_of_day={k: Decimal(str(round(v, 2))) for k, v in by_time.items()},
-            by_day_type={k: Decimal(str(round(v, 2))) for k, v in by_day.items()},
+            by_emotion={k: round(v, 2) for k, v in by_emotion.items()},
+            by_time_of_day={k: round(v, 2) for k, v in by_time.items()},
+            by_day_type={k: round(v, 2) for k, v in by_day.items()},
             average_stress_level=round(avg_stress, 2),
             average_regret_level=round(avg_regret, 2),
             top_triggers=top_triggers,
             highest_spending_emotion=highest_emotion,
             purchases_with_regret=regret_count,
             purchases_that_brought_joy=joy_count
-        )
\ No newline at end of file
+        )
+    
+    def _emotion_breakdown(self, key_column, month_filters):
+        """JSONB {key: total} of expense amounts grouped by an emotion column"""
+        grouped = self.db.query(
+            key_column.label('key'),
+            func.sum(Expense.amount).label('total')
+        ).select_from(
+            Expense
+        ).join(
+            ExpenseEmotion
+        ).filter(
+            *month_filters,
+            key_column != None,
+            key_column != ''
+        ).group_by(
+            key_column
+        ).subquery()
+        
+        return self.db.query(
+            func.coalesce(
+                func.jsonb_object_agg(grouped.c.key, grouped.c.total),
+                text("'{}'::jsonb")
+            )
+        ).scalar_subquery()
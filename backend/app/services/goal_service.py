@@ -0,0 +1,127 @@
+# backend/app/services/goal_service.py
+"""
+Goal Service
+Business logic for financial goals and goal contributions
+"""
+
+from sqlalchemy.orm import Session
+from uuid import UUID
+from datetime import datetime
+
+from app.models.goal import FinancialGoal, GoalProgressHistory
+from app.schemas.goal import FinancialGoalCreate, FinancialGoalUpdate, GoalProgressCreate
+from app.core.exceptions import NotFoundError
+from app.core.cache import invalidate_dashboard
+
+
+class GoalService:
+    """Service for managing financial goals"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ============================================
+    # GOAL CRUD
+    # ============================================
+
+    def create_goal(self, user_id: UUID, data: FinancialGoalCreate) -> FinancialGoal:
+        """Create a new financial goal"""
+
+        goal = FinancialGoal(
+            **data.dict(),
+            user_id=user_id
+        )
+
+        self.db.add(goal)
+        self.db.commit()
+        invalidate_dashboard(user_id)
+        self.db.refresh(goal)
+
+        return goal
+
+    def get_goal(self, goal_id: UUID, user_id: UUID) -> FinancialGoal:
+        """Get a single goal owned by the user"""
+
+        goal = self.db.query(FinancialGoal).filter(
+            FinancialGoal.goal_id == goal_id,
+            FinancialGoal.user_id == user_id
+        ).first()
+
+        if not goal:
+            raise NotFoundError("Goal not found")
+
+        return goal
+
+    def update_goal(
+        self,
+        goal_id: UUID,
+        user_id: UUID,
+        data: FinancialGoalUpdate
+    ) -> FinancialGoal:
+        """Update a goal"""
+
+        goal = self.get_goal(goal_id, user_id)
+
+        for field, value in data.dict(exclude_unset=True).items():
+            setattr(goal, field, value)
+
+        # If status changed to completed, set completed_at
+        if data.status == "completed" and not goal.completed_at:
+            goal.completed_at = datetime.utcnow()
+
+        self.db.commit()
+        invalidate_dashboard(user_id)
+        self.db.refresh(goal)
+
+        return goal
+
+    def delete_goal(self, goal_id: UUID, user_id: UUID) -> None:
+        """Delete a goal"""
+
+        goal = self.get_goal(goal_id, user_id)
+
+        self.db.delete(goal)
+        self.db.commit()
+        invalidate_dashboard(user_id)
+
+    # ============================================
+    # GOAL PROGRESS
+    # ============================================
+
+    def add_progress(
+        self,
+        goal_id: UUID,
+        user_id: UUID,
+        data: GoalProgressCreate
+    ) -> GoalProgressHistory:
+        """Add a contribution to a goal"""
+
+        goal = self.get_goal(goal_id, user_id)
+
+        goal.current_amount += data.amount_added
+        new_total = goal.current_amount
+
+        progress_percentage = (new_total / goal.target_amount) * 100 if goal.target_amount > 0 else 0
+
+        progress = GoalProgressHistory(
+            goal_id=goal_id,
+            amount_added=data.amount_added,
+            new_total=new_total,
+            progress_percentage=progress_percentage,
+            contribution_date=data.contribution_date,
+            source=data.source,
+            notes=data.notes
+        )
+
+        self.db.add(progress)
+
+        # Check if goal is completed
+        if goal.current_amount >= goal.target_amount and goal.status == 'active':
+            goal.status = 'completed'
+            goal.completed_at = datetime.utcnow()
+
+        self.db.commit()
+        invalidate_dashboard(user_id)
+        self.db.refresh(progress)
+
+        return progress
@@ -18,6 +18,7 @@ from app.schemas.income import (
     StudentJobSetup, ScholarshipSetup
 )
 from app.core.exceptions import NotFoundError, ValidationError
+from app.core.cache import invalidate_dashboard
 
 
 class IncomeService:
@@ -66,6 +67,7 @@ class IncomeService:
         
         self.db.add(income)
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(income)
         
         return income
@@ -133,6 +135,7 @@ class IncomeService:
             setattr(income, field, value)
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(income)
         
         return income
@@ -153,6 +156,7 @@ class IncomeService:
             income.is_active = False
         
         self.db.commit()
+        invalidate_dashboard(user_id)
     
     # ============================================
     # INCOME LOGGING
@@ -225,6 +229,7 @@ class IncomeService:
             income.next_payment_date = income.calculate_next_payment_date(data.payment_date)
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(history)
         self.db.refresh(income)
         
@@ -274,6 +279,7 @@ class IncomeService:
             history.total_deductions = history.gross_amount - actual_net
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(history)
         
         return history
@@ -314,12 +320,12 @@ class IncomeService:
             by_source[s.source_name] = s.estimated_monthly_net
         
         return IncomeStats(
-            total_monthly_gross=Decimal(str(round(total_monthly_gross, 2))),
-            total_monthly_net=Decimal(str(round(total_monthly_net, 2))),
-            total_annual_gross=Decimal(str(round(total_monthly_gross * 12, 2))),
-            total_annual_net=Decimal(str(round(total_monthly_net * 12, 2))),
-            guaranteed_monthly=Decimal(str(round(guaranteed_monthly, 2))),
-            variable_monthly=Decimal(str(round(variable_monthly, 2))),
+            total_monthly_gross=round(total_monthly_gross, 2),
+            total_monthly_net=round(total_monthly_net, 2),
+            total_annual_gross=round(total_monthly_gross * 12, 2),
+            total_annual_net=round(total_monthly_net * 12, 2),
+            guaranteed_monthly=round(guaranteed_monthly, 2),
+            variable_monthly=round(variable_monthly, 2),
             active_sources_count=len(sources),
             average_effective_tax_rate=round(avg_tax_rate, 2),
             by_type={k: round(v, 2) for k, v in by_type.items()},
@@ -334,35 +340,49 @@ class IncomeService:
     ) -> MonthlyIncomeBreakdown:
         """Get actual income received in a month"""
         
-        # Get all income history for the month
-        history = self.db.query(IncomeHistory).join(
-            IncomeSource
-        ).filter(
+        month_filters = (
             IncomeSource.user_id == user_id,
             extract('year', IncomeHistory.payment_date) == year,
             extract('month', IncomeHistory.payment_date) == month
-        ).all()
+        )
         
-        total_gross = sum(float(h.gross_amount) for h in history)
-        total_net = sum(float(h.net_amount) for h in history)
-        total_taxes = sum(float(h.total_deductions or 0) for h in history)
+        # Totals for the month
+        totals = self.db.query(
+            func.sum(IncomeHistory.gross_amount),
+            func.sum(IncomeHistory.net_amount),
+            func.sum(IncomeHistory.total_deductions)
+        ).join(
+            IncomeSource
+        ).filter(*month_filters).first()
+        
+        total_gross = float(totals[0] or 0)
+        total_net = float(totals[1] or 0)
+        total_taxes = float(totals[2] or 0)
+        
+        # By source, as one JSONB object
+        by_source_rows = self.db.query(
+            IncomeSource.source_name.label('name'),
+            func.sum(IncomeHistory.net_amount).label('total')
+        ).select_from(
+            IncomeHistory
+        ).join(
+            IncomeSource
+        ).filter(
+            *month_filters
+        ).group_by(
+            IncomeSource.source_name
+        ).subquery()
         
-        # By source
-        by_source: Dict[str, float] = {}
-        for h in history:
-            source = self.db.query(IncomeSource).filter(
-                IncomeSource.income_id == h.income_id
-            ).first()
-            if source:
-                name = source.source_name
-                by_source[name] = by_source.get(name, 0) + float(h.net_amount)
+        by_source: Dict[str, float] = self.db.query(
+            func.jsonb_object_agg(by_source_rows.c.name, by_source_rows.c.total)
+        ).scalar() or {}
         
         return MonthlyIncomeBreakdown(
             year=year,
             month=month,
-            total_gross=Decimal(str(round(total_gross, 2))),
-            total_net=Decimal(str(round(total_net, 2))),
-            total_taxes=Decimal(str(round(total_taxes, 2))),
+            total_gross=round(total_gross, 2),
+            total_net=round(total_net, 2),
+            total_taxes=round(total_taxes, 2),
             by_source={k: round(v, 2) for k, v in by_source.items()}
         )
     
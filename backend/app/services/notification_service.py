@@ -18,10 +18,12 @@ from app.models.expense import DailyCheckin, SpendingStreak
 from app.models.goal import FinancialGoal
 from app.schemas.notification import (
     NotificationCreate, NotificationUpdate,
+    BudgetAlertPayload, GoalMilestonePayload,
     ReminderCreate, ReminderUpdate, SnoozeReminderRequest,
     NotificationPreferenceUpdate
 )
 from app.core.exceptions import NotFoundError, ValidationError
+from app.core.cache import invalidate_dashboard
 
 
 class NotificationService:
@@ -48,13 +50,14 @@ class NotificationService:
             priority=data.priority,
             category=data.category,
             action_type=data.action_type,
-            action_data=data.action_data,
+            action_data=data.action_data.model_dump(mode='json') if data.action_data else None,
             scheduled_for=data.scheduled_for,
             expires_at=data.expires_at,
         )
         
         self.db.add(notification)
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(notification)
         
         return notification
@@ -65,11 +68,13 @@ class NotificationService:
         unread_only: bool = False,
         category: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
-    ) -> Tuple[List[Notification], int, int]:
+        offset: int = 0,
+        with_total: bool = True
+    ) -> Tuple[List[Notification], Optional[int], int]:
         """
         Get notifications for a user.
         Returns: (notifications, total_count, unread_count)
+        total_count is None when with_total is False (skips the count query).
         """
         query = self.db.query(Notification).filter(
             Notification.user_id == user_id,
@@ -86,7 +91,7 @@ class NotificationService:
         if category:
             query = query.filter(Notification.category == category)
         
-        total = query.count()
+        total = query.count() if with_total else None
         
         unread = self.db.query(func.count(Notification.notification_id)).filter(
             Notification.user_id == user_id,
@@ -114,6 +119,7 @@ class NotificationService:
         notification.read_at = datetime.utcnow()
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(notification)
         
         return notification
@@ -129,6 +135,7 @@ class NotificationService:
         })
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         return count
     
     def dismiss_notification(self, user_id: UUID, notification_id: UUID) -> None:
@@ -143,6 +150,7 @@ class NotificationService:
         
         notification.is_dismissed = True
         self.db.commit()
+        invalidate_dashboard(user_id)
     
     def clear_old_notifications(self, days: int = 30) -> int:
         """Delete notifications older than X days"""
@@ -177,7 +185,7 @@ class NotificationService:
                 priority="high",
                 category="budget",
                 action_type="open_budget",
-                action_data={"budget_id": str(budget_id)},
+                action_data=BudgetAlertPayload(budget_id=budget_id),
             )
         )
     
@@ -198,7 +206,7 @@ class NotificationService:
                 priority="normal",
                 category="goal",
                 action_type="open_goal",
-                action_data={"goal_id": str(goal_id)},
+                action_data=GoalMilestonePayload(goal_id=goal_id),
             )
         )
     
@@ -17,10 +17,11 @@ from app.models.recurring_expense import (
 )
 from app.schemas.recurring_expense import (
     RecurringExpenseCreate, RecurringExpenseUpdate,
-    RecordPaymentRequest, RecurringExpenseStats,
-    MonthlyRecurringBreakdown, VariableExpenseAnalysis
+    RecordPaymentRequest, RecurringExpenseStatsStruct,
+    MonthlyRecurringBreakdownStruct, VariableExpenseAnalysisStruct
 )
 from app.core.exceptions import NotFoundError, ValidationError
+from app.core.cache import invalidate_dashboard
 
 
 class RecurringExpenseService:
@@ -70,6 +71,7 @@ class RecurringExpenseService:
         
         self.db.add(expense)
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(expense)
         
         return expense
@@ -150,6 +152,7 @@ class RecurringExpenseService:
             setattr(expense, field, value)
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(expense)
         
         return expense
@@ -170,6 +173,7 @@ class RecurringExpenseService:
             expense.is_active = False
         
         self.db.commit()
+        invalidate_dashboard(user_id)
     
     # ============================================
     # PAYMENT TRACKING
@@ -222,6 +226,7 @@ class RecurringExpenseService:
             expense.next_due_date = expense.calculate_next_due_date()
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(history)
         self.db.refresh(expense)
         
@@ -320,7 +325,7 @@ class RecurringExpenseService:
     # STATISTICS & ANALYTICS
     # ============================================
     
-    def get_stats(self, user_id: UUID) -> RecurringExpenseStats:
+    def get_stats(self, user_id: UUID) -> RecurringExpenseStatsStruct:
         """Get statistics for recurring expenses"""
         
         expenses = self.get_user_recurring_expenses(user_id, is_active=True)
@@ -343,11 +348,11 @@ class RecurringExpenseService:
         upcoming_7 = len([e for e in expenses if e.days_until_due is not None and 0 <= e.days_until_due <= 7])
         overdue = len([e for e in expenses if e.is_overdue])
         
-        return RecurringExpenseStats(
-            total_monthly_recurring=Decimal(str(round(total_monthly, 2))),
-            total_annual_recurring=Decimal(str(round(total_annual, 2))),
-            essential_monthly=Decimal(str(round(essential_monthly, 2))),
-            discretionary_monthly=Decimal(str(round(discretionary_monthly, 2))),
+        return RecurringExpenseStatsStruct(
+            total_monthly_recurring=round(total_monthly, 2),
+            total_annual_recurring=round(total_annual, 2),
+            essential_monthly=round(essential_monthly, 2),
+            discretionary_monthly=round(discretionary_monthly, 2),
             total_active_expenses=len(expenses),
             bills_count=len(bills),
             subscriptions_count=len(subscriptions),
@@ -361,7 +366,7 @@ class RecurringExpenseService:
         user_id: UUID,
         year: int,
         month: int
-    ) -> MonthlyRecurringBreakdown:
+    ) -> MonthlyRecurringBreakdownStruct:
         """Get breakdown of recurring expenses for a specific month"""
         
         # Get all active recurring expenses
@@ -391,20 +396,20 @@ class RecurringExpenseService:
             else:
                 discretionary_total += monthly_cost
         
-        return MonthlyRecurringBreakdown(
+        return MonthlyRecurringBreakdownStruct(
             month=f"{year}-{month:02d}",
             by_type={k: round(v, 2) for k, v in by_type.items()},
             by_category={k: round(v, 2) for k, v in by_category.items()},
-            total=Decimal(str(round(total, 2))),
-            essential_total=Decimal(str(round(essential_total, 2))),
-            discretionary_total=Decimal(str(round(discretionary_total, 2)))
+            total=round(total, 2),
+            essential_total=round(essential_total, 2),
+            discretionary_total=round(discretionary_total, 2)
         )
     
     def analyze_variable_expense(
         self,
         recurring_id: UUID,
         user_id: UUID
-    ) -> VariableExpenseAnalysis:
+    ) -> VariableExpenseAnalysisStruct:
         """Analyze a variable recurring expense (like utilities)"""
         
         expense = self.get_recurring_expense(recurring_id, user_id)
@@ -455,13 +460,13 @@ class RecurringExpenseService:
         
         seasonal_pattern = {k: round(statistics.mean(v), 2) for k, v in seasonal.items() if v}
         
-        return VariableExpenseAnalysis(
+        return VariableExpenseAnalysisStruct(
             recurring_id=expense.recurring_id,
             expense_name=expense.expense_name,
-            avg_amount=Decimal(str(round(avg, 2))),
-            min_recorded=Decimal(str(round(min_amt, 2))),
-            max_recorded=Decimal(str(round(max_amt, 2))),
-            std_deviation=Decimal(str(round(std_dev, 2))),
+            avg_amount=round(avg, 2),
+            min_recorded=round(min_amt, 2),
+            max_recorded=round(max_amt, 2),
+            std_deviation=round(std_dev, 2),
             trend=trend,
             trend_percentage=round(trend_pct, 2),
             seasonal_pattern=seasonal_pattern if len(seasonal_pattern) > 1 else None,
@@ -511,6 +516,7 @@ class RecurringExpenseService:
         expense.is_active = False
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(expense)
         
         return expense
@@ -531,6 +537,7 @@ class RecurringExpenseService:
             expense.next_due_date = expense.calculate_next_due_date(date.today())
         
         self.db.commit()
+        invalidate_dashboard(user_id)
         self.db.refresh(expense)
         
         return expense
\ No newline at end of file
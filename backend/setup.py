@@ -0,0 +1,33 @@
+# backend/setup.py
+"""
+Fortuna Backend Build
+Compiles the Pydantic schema modules with Cython for production wheels.
+
+Set SKIP_CYTHON=1 for development installs to keep the pure-Python sources.
+"""
+
+import os
+from setuptools import setup, find_packages
+
+ext_modules = []
+
+if os.environ.get("SKIP_CYTHON") != "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["app/schemas/*.py"],
+        exclude=["app/schemas/__init__.py"],
+        language_level=3,
+    )
+
+setup(
+    name="fortuna-backend",
+    version="0.1.0",
+    packages=find_packages(include=["app", "app.*"]),
+    install_requires=[
+        "msgspec>=0.18",
+        "orjson>=3.9",
+    ],
+    ext_modules=ext_modules,
+    zip_safe=False,
+)
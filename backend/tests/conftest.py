@@ -0,0 +1,10 @@
+# backend/tests/conftest.py
+"""
+Test configuration
+Settings require these values at import; no test connects to them.
+"""
+
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("DB_PASSWORD", "test")
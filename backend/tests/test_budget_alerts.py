@@ -0,0 +1,147 @@
+# backend/tests/test_budget_alerts.py
+"""
+Budget alert tests
+Runs record_expense_to_budget against an in-memory SQLite database.
+"""
+
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  (registers every mapper)
+from app.database import Base
+from app.models.budget import Budget, CategoryBudget
+from app.models.expense import ExpenseCategory
+from app.models.notification import Notification
+from app.models.user import User
+from app.services.budget_service import BudgetService
+
+
+@compiles(ExcludeConstraint, "sqlite")
+def _skip_exclude_constraint(constraint, compiler, **kw):
+    # Postgres-only (gist); not needed for these tests
+    return None
+
+
+TABLES = ("users", "expense_categories", "budgets", "category_budgets", "notifications")
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Base.metadata.tables[name] for name in TABLES])
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def budget(db):
+    user = User(
+        email="alerts@example.com",
+        password_hash="x",
+        full_name="Alert Test",
+        date_of_birth=datetime(2000, 1, 2),
+    )
+    db.add(user)
+    db.flush()
+    budget = Budget(
+        user_id=user.user_id,
+        budget_name="Monthly",
+        budget_type="monthly",
+        start_date=date.today() - timedelta(days=1),
+        end_date=date.today() + timedelta(days=1),
+        total_amount=Decimal("100.00"),
+        spent_amount=Decimal("0"),
+        alert_at_percentage=80,
+        alert_sent=False,
+    )
+    db.add(budget)
+    db.commit()
+    return budget
+
+
+def _log(db, budget, amount, category_id=None):
+    expense = SimpleNamespace(amount=Decimal(amount), category_id=category_id)
+    BudgetService(db).record_expense_to_budget(budget.user_id, expense)
+
+
+def _alert_count(db, user_id):
+    return db.query(Notification).filter(
+        Notification.user_id == user_id,
+        Notification.notification_type == "budget_alert"
+    ).count()
+
+
+def test_budget_alert_sent_once_for_consecutive_writes_over_threshold(db, budget):
+    _log(db, budget, "50.00")
+    assert _alert_count(db, budget.user_id) == 0
+
+    _log(db, budget, "35.00")
+    assert _alert_count(db, budget.user_id) == 1
+
+    _log(db, budget, "5.00")
+    assert _alert_count(db, budget.user_id) == 1
+
+
+def test_flagged_budget_not_alerted_again_after_crossing_back(db, budget):
+    _log(db, budget, "85.00")
+    assert _alert_count(db, budget.user_id) == 1
+
+    # Spend drops back below the threshold (e.g. an expense was deleted)
+    # while the budget stays flagged
+    budget.spent_amount = Decimal("50.00")
+    db.commit()
+
+    _log(db, budget, "35.00")
+    assert _alert_count(db, budget.user_id) == 1
+
+
+def test_missing_alert_percentage_uses_default(db, budget):
+    budget.alert_at_percentage = None
+    db.commit()
+
+    _log(db, budget, "79.00")
+    assert _alert_count(db, budget.user_id) == 0
+
+    _log(db, budget, "1.00")
+    assert _alert_count(db, budget.user_id) == 1
+
+
+def test_category_alert_sent_once_per_flag(db, budget):
+    budget.total_amount = Decimal("1000.00")
+    category = ExpenseCategory(category_id=uuid.uuid4(), category_name="Dining", category_type="variable")
+    db.add(category)
+    category_budget = CategoryBudget(
+        budget_id=budget.budget_id,
+        category_id=category.category_id,
+        allocated_amount=Decimal("50.00"),
+        spent_amount=Decimal("0"),
+        alert_at_percentage=80,
+        alert_sent=False,
+    )
+    db.add(category_budget)
+    db.commit()
+
+    _log(db, budget, "45.00", category.category_id)
+    assert _alert_count(db, budget.user_id) == 1
+
+    _log(db, budget, "2.00", category.category_id)
+    assert _alert_count(db, budget.user_id) == 1
+
+    # Back below the threshold while still flagged, then over it again
+    category_budget.spent_amount = Decimal("10.00")
+    db.commit()
+
+    _log(db, budget, "35.00", category.category_id)
+    assert _alert_count(db, budget.user_id) == 1
@@ -0,0 +1,23 @@
+# backend/tests/test_dependent_model.py
+"""
+Dependent model property tests
+"""
+
+from decimal import Decimal
+
+from app.models.dependent import Dependent
+
+
+def test_monthly_share_uses_percentage():
+    dependent = Dependent(monthly_cost_estimate=Decimal("200.00"), your_share_percentage=Decimal("25.00"))
+    assert dependent.your_monthly_share == 50.0
+
+
+def test_monthly_share_is_zero_for_zero_percent():
+    dependent = Dependent(monthly_cost_estimate=Decimal("200.00"), your_share_percentage=Decimal("0.00"))
+    assert dependent.your_monthly_share == 0.0
+
+
+def test_monthly_share_defaults_to_full_cost():
+    dependent = Dependent(monthly_cost_estimate=Decimal("200.00"), your_share_percentage=None)
+    assert dependent.your_monthly_share == 200.0
@@ -7,6 +7,7 @@
 -- Enable extensions
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
+CREATE EXTENSION IF NOT EXISTS "btree_gist";
 
 -- ============================================
 -- USERS & PROFILES
@@ -713,8 +714,11 @@ CREATE TABLE notifications (
 -- ============================================
 
 CREATE INDEX idx_users_email ON users(email);
-CREATE INDEX idx_expenses_user_date ON expenses(user_id, expense_date DESC);
+CREATE INDEX idx_expenses_user_date ON expenses(user_id, expense_date DESC) INCLUDE (amount, category_id);
+CREATE INDEX idx_expenses_user_category_date ON expenses(user_id, category_id, expense_date) INCLUDE (amount);
+CREATE INDEX idx_expenses_user_date_created ON expenses(user_id, expense_date DESC, created_at DESC) INCLUDE (amount, merchant_name, category_id);
 CREATE INDEX idx_expenses_category ON expenses(category_id);
+CREATE INDEX idx_expense_emotions_expense ON expense_emotions(expense_id);
 CREATE INDEX idx_expense_emotions_user ON expense_emotions(user_id);
 CREATE INDEX idx_expense_emotions_emotion ON expense_emotions(primary_emotion);
 CREATE INDEX idx_income_sources_user ON income_sources(user_id);
@@ -726,6 +730,7 @@ CREATE INDEX idx_monthly_analysis_user_month ON monthly_emotional_analysis(user_
 CREATE INDEX idx_ai_insights_user_created ON ai_insights(user_id, created_at DESC);
 CREATE INDEX idx_notifications_user_read ON notifications(user_id, is_read);
 CREATE INDEX idx_dependents_user ON dependents(user_id);
+CREATE INDEX idx_dependent_expenses_dependent_date ON dependent_expenses(dependent_id, expense_date DESC) INCLUDE (amount);
 CREATE INDEX idx_behavioral_patterns_user ON user_behavior_patterns(user_id);
 
 -- ============================================